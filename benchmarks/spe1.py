@@ -6,6 +6,7 @@ app = marimo.App(width="full")
 
 @app.cell
 def setup_grid():
+    import functools
     import logging
     import typing
     from pathlib import Path
@@ -33,6 +34,11 @@ def setup_grid():
     cell_dimension = (1000.0, 1000.0)  # DX, DY in feet
     grid_shape = (10, 10, 3)
 
+    # All constant-valued grids share the same shape. Each call still returns
+    # its own array since the model (and `Run.validate(correct_inplace=True)`)
+    # may write to them, so grids must not alias one another.
+    uniform_grid = functools.partial(bores.uniform_grid, grid_shape=grid_shape)
+
     layer_thicknesses = bores.array([20.0, 30.0, 50.0])  # ft, layers 1-3
     thickness_grid = bores.layered_grid(
         grid_shape=grid_shape,
@@ -66,15 +72,14 @@ def setup_grid():
     )
 
     # Temperature: 200°F (Table 1, constant throughout)
-    temperature_grid = bores.uniform_grid(grid_shape=grid_shape, value=200.0)
+    temperature_grid = uniform_grid(value=200.0)
 
     # -------------------------------------------------------------------------
     # Bubble-point pressure
     # From Table 2: Pb = 4014.7 psia (highest saturated Rs table pressure)
     # Pi = 4800 psia > Pb -> reservoir initially UNDERSATURATED
     # -------------------------------------------------------------------------
-    oil_bubble_point_pressure_grid = bores.uniform_grid(
-        grid_shape=grid_shape,
+    oil_bubble_point_pressure_grid = uniform_grid(
         value=4014.7,  # psia — constant bubble point (Case 1)
     )
 
@@ -83,7 +88,7 @@ def setup_grid():
     # Porosity = 0.3
     # Rock compressibility = 3×10⁻⁶ 1/psi
     # -------------------------------------------------------------------------
-    porosity_grid = bores.uniform_grid(grid_shape=grid_shape, value=0.3)
+    porosity_grid = uniform_grid(value=0.3)
     rock_compressibility = 3.0e-6  # 1/psi
 
     # -------------------------------------------------------------------------
@@ -101,18 +106,14 @@ def setup_grid():
     # the ECLIPSE/CMG reference datasets use kv = 0.1*kh per layer.
     # Use the kv/kh = 0.1 values which are more physically consistent.
     # -------------------------------------------------------------------------
-    kx_values = bores.array([500.0, 50.0, 200.0])  # mD
-    ky_values = bores.array([500.0, 50.0, 200.0])  # mD
+    kh_values = bores.array([500.0, 50.0, 200.0])  # mD  (kx = ky)
     kz_values = bores.array([50.0, 5.0, 20.0])  # mD  (kv = 0.1 × kh)
 
-    kx_grid = bores.layered_grid(
-        grid_shape=grid_shape,
-        layer_values=kx_values,
-        orientation=bores.Orientation.Z,
-    )
-    ky_grid = bores.layered_grid(
+    # kx and ky are identical, so build the horizontal grid once and copy it
+    # for ky, keeping the two grids from aliasing (see `uniform_grid` above).
+    kh_grid = bores.layered_grid(
         grid_shape=grid_shape,
-        layer_values=ky_values,
+        layer_values=kh_values,
         orientation=bores.Orientation.Z,
     )
     kz_grid = bores.layered_grid(
@@ -120,27 +121,25 @@ def setup_grid():
         layer_values=kz_values,
         orientation=bores.Orientation.Z,
     )
-    absolute_permeability = bores.RockPermeability(x=kx_grid, y=ky_grid, z=kz_grid)
+    absolute_permeability = bores.RockPermeability(
+        x=kh_grid, y=kh_grid.copy(), z=kz_grid
+    )
 
-    net_to_gross_grid = bores.uniform_grid(grid_shape=grid_shape, value=1.0)
+    net_to_gross_grid = uniform_grid(value=1.0)
 
     # -------------------------------------------------------------------------
     # Initial saturations (Table 1)
     # Sw = 0.12 (connate), So = 0.88, Sg = 0.0
     # -------------------------------------------------------------------------
-    connate_water_saturation_grid = bores.uniform_grid(
-        grid_shape=grid_shape, value=0.12
-    )
+    connate_water_saturation_grid = uniform_grid(value=0.12)
     irreducible_water_saturation_grid = connate_water_saturation_grid.copy()
-    residual_oil_saturation_water_grid = bores.uniform_grid(
-        grid_shape=grid_shape, value=0.0
-    )
+    residual_oil_saturation_water_grid = uniform_grid(value=0.0)
     residual_oil_saturation_gas_grid = residual_oil_saturation_water_grid.copy()
     residual_gas_saturation_grid = residual_oil_saturation_water_grid.copy()
 
-    # oil_saturation_grid = bores.uniform_grid(grid_shape=grid_shape, value=0.88)
-    # water_saturation_grid = bores.uniform_grid(grid_shape=grid_shape, value=0.12)
-    # gas_saturation_grid = bores.uniform_grid(grid_shape=grid_shape, value=0.0)
+    # oil_saturation_grid = uniform_grid(value=0.88)
+    # water_saturation_grid = uniform_grid(value=0.12)
+    # gas_saturation_grid = uniform_grid(value=0.0)
     depth_grid = bores.depth_grid(thickness_grid, datum=8325.0)
     water_saturation_grid, oil_saturation_grid, gas_saturation_grid = (
         bores.build_saturation_grids(
@@ -172,9 +171,9 @@ def setup_grid():
     # Fluid properties (initial estimates — overridden by PVT tables)
     # -------------------------------------------------------------------------
     gas_gravity = 0.792  # Table 1
-    gas_gravity_grid = bores.uniform_grid(grid_shape=grid_shape, value=gas_gravity)
-    gas_viscosity_grid = bores.uniform_grid(grid_shape=grid_shape, value=0.027)
-    oil_viscosity_grid = bores.uniform_grid(grid_shape=grid_shape, value=0.51)
+    gas_gravity_grid = uniform_grid(value=gas_gravity)
+    gas_viscosity_grid = uniform_grid(value=0.027)
+    oil_viscosity_grid = uniform_grid(value=0.51)
 
     # Oil specific gravity from dead-oil density at 14.7 psia: 46.244 lb/ft³
     oil_specific_gravity = compute_oil_specific_gravity(
@@ -183,9 +182,7 @@ def setup_grid():
         temperature=200.0,
         oil_compressibility=0.0,
     )
-    oil_specific_gravity_grid = bores.uniform_grid(
-        grid_shape=grid_shape, value=oil_specific_gravity
-    )
+    oil_specific_gravity_grid = uniform_grid(value=oil_specific_gravity)
 
     # =========================================================================
     # PVT TABLES — Complete data from Table 2 (Odeh 1981)
@@ -347,7 +344,7 @@ def setup_grid():
     )
 
     # μw (cP): constant at 0.31 cP per the table
-    water_viscosity_values = bores.array([0.3100] * 9)
+    water_viscosity_values = np.full_like(pvt_pressures, 0.3100)
 
     # ρw (lbm/ft³): Table 2
     water_density_values = bores.array(
@@ -365,15 +362,18 @@ def setup_grid():
     )
 
     # Gas solubility in water (Rsw): zero throughout per Table 2
-    gas_solubility_in_water_values = bores.array([0.0] * 9)
+    gas_solubility_in_water_values = np.zeros_like(pvt_pressures)
 
 
     # -------------------------------------------------------------------------
     # Build 2-D tables (n_pressures × n_temperatures)
-    # Broadcast each 1-D array across the temperature axis (isothermal)
+    # Broadcast each 1-D array across the temperature axis (isothermal).
+    # These are read-only views, nothing writes into the tables.
     # -------------------------------------------------------------------------
     def make_2d(arr):
-        return np.column_stack([arr, arr])
+        return np.broadcast_to(
+            arr[:, np.newaxis], (arr.shape[0], pvt_temperatures.shape[0])
+        )
 
 
     solution_gor_table = typing.cast(
@@ -398,7 +398,7 @@ def setup_grid():
     # Water tables are 3-D: (n_pressures, n_temperatures, n_salinities)
     # SPE1 uses fresh water -> salinity = 0 ppm -> n_salinities = 1
     def make_3d(arr):
-        return np.stack([make_2d(arr)], axis=2)
+        return make_2d(arr)[:, :, np.newaxis]
 
 
     water_fvf_table = typing.cast(
@@ -467,20 +467,19 @@ def setup_grid():
         connate_water_saturation_grid=connate_water_saturation_grid,
         residual_gas_saturation_grid=residual_gas_saturation_grid,
         net_to_gross_grid=net_to_gross_grid,
-        water_salinity_grid=bores.array(np.zeros(grid_shape)),
+        water_salinity_grid=uniform_grid(value=0.0),
         dip_angle=0.0,
         dip_azimuth=0.0,
         pvt_tables=pvt_tables,
         datum_depth=8325.0,  # ft — top of reservoir
     )
 
-    model.save(Path("./benchmarks/runs/spe1/setup/model.h5"))
     pvt_tables.save(Path("./benchmarks/runs/spe1/setup/pvt.h5"))
-    return Path, bores, np, oil_specific_gravity, pvt_tables
+    return Path, bores, model, np, oil_specific_gravity, pvt_tables
 
 
 @app.cell
-def setup_config(Path, bores, oil_specific_gravity, pvt_tables):
+def setup_config(Path, bores, model, oil_specific_gravity, pvt_tables):
     from bores.correlations.core import compute_gas_molecular_weight
 
     # -------------------------------------------------------------------------
@@ -677,24 +676,29 @@ def setup_config(Path, bores, oil_specific_gravity, pvt_tables):
         maximum_pressure_change=500.0,
         cfl_threshold=0.3,
     )
-    config.save(Path("./benchmarks/runs/spe1/setup/config.yaml"))
-    return (wells,)
+    run = bores.Run(model=model, config=config)
+    # Model and config go into a single (chunked, compressed) HDF5 file.
+    # PVT tables are never part of a `Config` dump, so they keep their own file.
+    run.save(Path("./benchmarks/runs/spe1/setup/run.h5"))
+    return run, wells
 
 
 @app.cell
 def setup_store(Path, bores):
-    store = bores.HDF5Store(filepath=Path("./benchmarks/runs/spe1/results/spe1.h5"))
+    store = bores.ZarrStore(store=Path("./benchmarks/runs/spe1/results/spe1.zarr"))
     return
 
 
 @app.cell
-def run_simulation(Path, bores):
-    # Load run from saved files
-    run = bores.Run.from_files(
-        model_path=Path("./benchmarks/runs/spe1/setup/model.h5"),
-        config_path=Path("./benchmarks/runs/spe1/setup/config.yaml"),
-        pvt_tables_path=Path("./benchmarks/runs/spe1/setup/pvt.h5"),
-    )
+def run_simulation(run):
+    # The run built in `setup_config` is used as is. To resume in a fresh
+    # process, load it from the saved setup files instead:
+    # run = bores.Run.from_file(Path("./benchmarks/runs/spe1/setup/run.h5"))
+    # run.config = run.config.update(
+    #     pvt_tables=bores.PVTTables.from_file(
+    #         Path("./benchmarks/runs/spe1/setup/pvt.h5")
+    #     )
+    # )
 
     # with bores.StateStream(run, store=store, background_io=True) as stream:
     #     last_state = stream.last()
@@ -712,7 +716,7 @@ def load_states():
 
 
 @app.cell
-def setup_analysis(bores, states):
+def setup_analysis(bores, np, states):
     analyst = bores.ModelAnalyst(states)
 
     sweep_efficiency_history = analyst.sweep_efficiency_history(
@@ -725,53 +729,66 @@ def setup_analysis(bores, states):
         interval=1, from_step=1, rate_type="injection"
     )
 
-    oil_saturation_history = []
-    water_saturation_history = []
-    gas_saturation_history = []
-    avg_pressure_history = []
-
-    volumetric_sweep_efficiency_history = []
-    displacement_efficiency_history = []
-    recovery_efficiency_history = []
-
-    water_cut_history = []
-    gor_history = []
-    oil_rate_history = []
-    gas_rate_history = []
-    gas_injection_rate_history = []
-    water_rate_history = []
-
-    for s in states:
-        time_step = s.time_in_days
-        fluid_properties = s.model.fluid_properties
-        avg_oil_sat = fluid_properties.oil_saturation_grid.mean()
-        avg_water_sat = fluid_properties.water_saturation_grid.mean()
-        avg_gas_sat = fluid_properties.gas_saturation_grid[9, 9, 2]
-        avg_pressure = s.rates.injection_bhps.gas[0,0,0]
-
-        oil_saturation_history.append((time_step, avg_oil_sat))
-        water_saturation_history.append((time_step, avg_water_sat))
-        gas_saturation_history.append((time_step, avg_gas_sat))
-        avg_pressure_history.append((time_step, avg_pressure))
-
-    for time_step, result in sweep_efficiency_history:
-        volumetric_sweep_efficiency_history.append(
-            (time_step, result.volumetric_sweep_efficiency)
-        )
-        displacement_efficiency_history.append(
-            (time_step, result.displacement_efficiency)
-        )
-        recovery_efficiency_history.append((time_step, result.recovery_efficiency))
-
-    for time_step, result in production_rate_history:
-        oil_rate_history.append((time_step, result.oil_rate))
-        water_rate_history.append((time_step, result.water_rate))
-        gas_rate_history.append((time_step, result.gas_rate))
-        water_cut_history.append((time_step, result.water_cut))
-        gor_history.append((time_step, result.gas_oil_ratio))
-
-    for time_step, result in injection_rate_history:
-        gas_injection_rate_history.append((time_step, result.gas_rate))
+    # Stack per-state grids once and reduce over the cell axes in one call,
+    # rather than calling `mean` on every state.
+    time_steps = np.array([s.time_in_days for s in states])
+    fluid_properties = [s.model.fluid_properties for s in states]
+    avg_oil_sat = np.stack(
+        [fp.oil_saturation_grid for fp in fluid_properties]
+    ).mean(axis=(1, 2, 3))
+    avg_water_sat = np.stack(
+        [fp.water_saturation_grid for fp in fluid_properties]
+    ).mean(axis=(1, 2, 3))
+    avg_gas_sat = np.array(
+        [fp.gas_saturation_grid[9, 9, 2] for fp in fluid_properties]
+    )
+    avg_pressure = np.array([s.rates.injection_bhps.gas[0, 0, 0] for s in states])
+
+    oil_saturation_history = np.column_stack((time_steps, avg_oil_sat))
+    water_saturation_history = np.column_stack((time_steps, avg_water_sat))
+    gas_saturation_history = np.column_stack((time_steps, avg_gas_sat))
+    avg_pressure_history = np.column_stack((time_steps, avg_pressure))
+
+    def collect_histories(history, *attributes):
+        """
+        Fill one preallocated `(n_attributes, n_steps, 2)` array of
+        `(time_step, value)` rows, one slab per result attribute.
+        """
+        history = list(history)
+        collected = np.empty((len(attributes), len(history), 2))
+        for i, (time_step, result) in enumerate(history):
+            collected[:, i, 0] = time_step
+            for j, attribute in enumerate(attributes):
+                collected[j, i, 1] = getattr(result, attribute)
+        return collected
+
+    (
+        volumetric_sweep_efficiency_history,
+        displacement_efficiency_history,
+        recovery_efficiency_history,
+    ) = collect_histories(
+        sweep_efficiency_history,
+        "volumetric_sweep_efficiency",
+        "displacement_efficiency",
+        "recovery_efficiency",
+    )
+    (
+        oil_rate_history,
+        water_rate_history,
+        gas_rate_history,
+        water_cut_history,
+        gor_history,
+    ) = collect_histories(
+        production_rate_history,
+        "oil_rate",
+        "water_rate",
+        "gas_rate",
+        "water_cut",
+        "gas_oil_ratio",
+    )
+    (gas_injection_rate_history,) = collect_histories(
+        injection_rate_history, "gas_rate"
+    )
     return (
         analyst,
         avg_pressure_history,
@@ -789,10 +806,10 @@ def setup_analysis(bores, states):
 
 
 @app.cell
-def _(avg_pressure_history, bores, np):
+def _(avg_pressure_history, bores):
     # Pressure
     pressure_fig = bores.make_series_plot(
-        data={"Avg. Reservoir Pressure": np.array(avg_pressure_history[1:])},
+        data={"Avg. Reservoir Pressure": avg_pressure_history[1:]},
         title="Pressure Analysis",
         x_label="Time Step",
         y_label="Avg. Pressure (psia)",
@@ -805,13 +822,13 @@ def _(avg_pressure_history, bores, np):
 
 
 @app.cell
-def saturation_plots(bores, gas_saturation_history, np):
+def saturation_plots(bores, gas_saturation_history):
     # Saturation
     saturation_fig = bores.make_series_plot(
         data={
-            # "Avg. Water Saturation": np.array(water_saturation_history),
-            # "Avg. Oil Saturation": np.array(oil_saturation_history),
-            "Avg. Gas Saturation": np.array(gas_saturation_history),
+            # "Avg. Water Saturation": water_saturation_history,
+            # "Avg. Oil Saturation": oil_saturation_history,
+            "Avg. Gas Saturation": gas_saturation_history,
         },
         title="Saturation Analysis",
         x_label="Time Step",
@@ -825,10 +842,10 @@ def saturation_plots(bores, gas_saturation_history, np):
 
 
 @app.cell
-def _(bores, gas_rate_history, np, oil_rate_history, water_rate_history):
+def _(bores, gas_rate_history, oil_rate_history, water_rate_history):
     oil_rate_fig = bores.make_series_plot(
         data={
-            "Oil Rate (STB/day)": np.array(oil_rate_history),
+            "Oil Rate (STB/day)": oil_rate_history,
         },
         title="Oil Production Rate Analysis",
         x_label="Time Step",
@@ -839,7 +856,7 @@ def _(bores, gas_rate_history, np, oil_rate_history, water_rate_history):
     )
     water_rate_fig = bores.make_series_plot(
         data={
-            "Water Rate (STB/day)": np.array(water_rate_history),
+            "Water Rate (STB/day)": water_rate_history,
         },
         title="Water Production Rate Analysis",
         x_label="Time Step",
@@ -850,7 +867,7 @@ def _(bores, gas_rate_history, np, oil_rate_history, water_rate_history):
     )
     gas_rate_fig = bores.make_series_plot(
         data={
-            "Gas Rate (SCF/day)": np.array(gas_rate_history),
+            "Gas Rate (SCF/day)": gas_rate_history,
         },
         title="Gas Production Rate Analysis",
         x_label="Time Step",
@@ -871,10 +888,10 @@ def _(bores, gas_rate_history, np, oil_rate_history, water_rate_history):
 
 
 @app.cell
-def _(bores, gas_injection_rate_history, np):
+def _(bores, gas_injection_rate_history):
     gas_injection_rate_fig = bores.make_series_plot(
         data={
-            "Gas Rate (SCF/day)": np.array(gas_injection_rate_history),
+            "Gas Rate (SCF/day)": gas_injection_rate_history,
         },
         title="Gas Injection Rate Analysis",
         x_label="Time Step",
@@ -888,10 +905,10 @@ def _(bores, gas_injection_rate_history, np):
 
 
 @app.cell
-def fluid_cut_plots(bores, gor_history, np, water_cut_history):
+def fluid_cut_plots(bores, gor_history, water_cut_history):
     water_cut_fig = bores.make_series_plot(
         data={
-            "Water Cut (WOR)": np.array(water_cut_history),
+            "Water Cut (WOR)": water_cut_history,
         },
         title="Water Cut Analysis",
         x_label="Time Step",
@@ -902,7 +919,7 @@ def fluid_cut_plots(bores, gor_history, np, water_cut_history):
     )
     gor_fig = bores.make_series_plot(
         data={
-            "Gas-Oil Ratio (GOR)": np.array(gor_history),
+            "Gas-Oil Ratio (GOR)": gor_history,
         },
         title="Gas-Oil Ratio Analysis",
         x_label="Time Step",
@@ -920,14 +937,18 @@ def fluid_cut_plots(bores, gor_history, np, water_cut_history):
 
 
 @app.cell
-def oil_production_plot(analyst, bores, np):
+def oil_production_plot(analyst, bores):
     # Production & Injection
+    # Production/injection histories yield one entry per step from `from_step`
+    # through `max_step`, so their length is known up front.
     oil_production_history = analyst.oil_production_history(
         interval=1, cumulative=True, from_step=1
     )
     oil_production_fig = bores.make_series_plot(
         data={
-            "Oil Production": np.array(list(oil_production_history)),
+            "Oil Production": bores.series_to_array(
+                oil_production_history, count=analyst.max_step
+            ),
         },
         title="Oil Production Analysis",
         x_label="Time Step",
@@ -941,13 +962,15 @@ def oil_production_plot(analyst, bores, np):
 
 
 @app.cell
-def gas_production_plot(analyst, bores, np):
+def gas_production_plot(analyst, bores):
     gas_production_history = analyst.gas_production_history(
         interval=1, cumulative=False, from_step=1
     )
     gas_production_fig = bores.make_series_plot(
         data={
-            "Gas Production": np.array(list(gas_production_history)),
+            "Gas Production": bores.series_to_array(
+                gas_production_history, count=analyst.max_step
+            ),
         },
         title="Gas Production Analysis",
         x_label="Time Step",
@@ -961,13 +984,15 @@ def gas_production_plot(analyst, bores, np):
 
 
 @app.cell
-def gas_injection_plot(analyst, bores, np):
+def gas_injection_plot(analyst, bores):
     gas_injection_history = analyst.gas_injection_history(
         interval=1, cumulative=False, from_step=1
     )
     gas_injection_fig = bores.make_series_plot(
         data={
-            "Gas Injection": np.array(list(gas_injection_history)),
+            "Gas Injection": bores.series_to_array(
+                gas_injection_history, count=analyst.max_step
+            ),
         },
         title="Gas Injection Analysis",
         x_label="Time Step",
@@ -981,7 +1006,7 @@ def gas_injection_plot(analyst, bores, np):
 
 
 @app.cell
-def reserves_plots(analyst, bores, np):
+def reserves_plots(analyst, bores):
     # Reserves
     oil_in_place_history = analyst.oil_in_place_history(interval=1, from_step=1)
     gas_in_place_history = analyst.gas_in_place_history(interval=1, from_step=1)
@@ -989,8 +1014,8 @@ def reserves_plots(analyst, bores, np):
 
     oil_water_reserves_fig = bores.make_series_plot(
         data={
-            "Oil In Place": np.array(list(oil_in_place_history)),
-            "Water In Place": np.array(list(water_in_place_history)),
+            "Oil In Place": bores.series_to_array(oil_in_place_history),
+            "Water In Place": bores.series_to_array(water_in_place_history),
         },
         title="Oil & Water Reserves Analysis",
         x_label="Time Step",
@@ -1001,7 +1026,7 @@ def reserves_plots(analyst, bores, np):
     )
     gas_reserve_fig = bores.make_series_plot(
         data={
-            "Gas In Place": np.array(list(gas_in_place_history)),
+            "Gas In Place": bores.series_to_array(gas_in_place_history),
         },
         title="Gas Reserve Analysis",
         x_label="Time Step",
@@ -1025,13 +1050,12 @@ def reserves_plots(analyst, bores, np):
 def sweep_efficiency_plots(
     bores,
     displacement_efficiency_history,
-    np,
     volumetric_sweep_efficiency_history,
 ):
     # Sweep efficiencies
     displacement_efficiency_fig = bores.make_series_plot(
         data={
-            "Displacement Efficiency": np.array(displacement_efficiency_history),
+            "Displacement Efficiency": displacement_efficiency_history,
         },
         title="Displacement Efficiency Analysis",
         x_label="Time Step",
@@ -1042,7 +1066,7 @@ def sweep_efficiency_plots(
     )
     vol_sweep_efficiency_fig = bores.make_series_plot(
         data={
-            "Vol. Sweep Efficiency": np.array(volumetric_sweep_efficiency_history),
+            "Vol. Sweep Efficiency": volumetric_sweep_efficiency_history,
         },
         title="Volumetric Sweep Efficiency Analysis",
         x_label="Time Step",
@@ -1062,10 +1086,10 @@ def sweep_efficiency_plots(
 
 
 @app.cell
-def recovery_plots(analyst, bores, np, recovery_efficiency_history):
+def recovery_plots(analyst, bores, recovery_efficiency_history):
     recovery_efficiency_fig = bores.make_series_plot(
         data={
-            "Recovery Efficiency": np.array(recovery_efficiency_history),
+            "Recovery Efficiency": recovery_efficiency_history,
         },
         title="Recovery Efficiency Analysis",
         x_label="Time Step",
@@ -1080,7 +1104,7 @@ def recovery_plots(analyst, bores, np, recovery_efficiency_history):
     )
     recovery_factor_fig = bores.make_series_plot(
         data={
-            "Oil Recovery Factor": np.array(list(oil_recovery_factor_history)),
+            "Oil Recovery Factor": bores.series_to_array(oil_recovery_factor_history),
         },
         title="Recovery Factor Analysis",
         x_label="Time Step",
@@ -299,14 +299,14 @@ def _(bores, np, oil_relative_mobility_history):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     # Production & Injection
     oil_production_history = analyst.oil_production_history(
         interval=1, cumulative=False, from_step=1
     )
     oil_production_fig = bores.make_series_plot(
         data={
-            "Oil Production": np.array(list(oil_production_history)),
+            "Oil Production": bores.series_to_array(oil_production_history),
         },
         title="Oil Production Analysis (CASE 3)",
         x_label="Time Step",
@@ -320,13 +320,13 @@ def _(analyst, bores, np):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     water_production_history = analyst.water_production_history(
         interval=1, cumulative=False, from_step=1
     )
     water_production_fig = bores.make_series_plot(
         data={
-            "Water Production": np.array(list(water_production_history)),
+            "Water Production": bores.series_to_array(water_production_history),
         },
         title="Water Production Analysis (CASE 3)",
         x_label="Time Step",
@@ -340,13 +340,13 @@ def _(analyst, bores, np):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     gas_production_history = analyst.gas_production_history(
         interval=1, cumulative=False, from_step=1
     )
     gas_production_fig = bores.make_series_plot(
         data={
-            "Gas Production": np.array(list(gas_production_history)),
+            "Gas Production": bores.series_to_array(gas_production_history),
         },
         title="Gas Production Analysis (CASE 3)",
         x_label="Time Step",
@@ -360,14 +360,14 @@ def _(analyst, bores, np):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     gas_injection_history = analyst.gas_injection_history(
         interval=1, cumulative=False, from_step=7
     )
     gas_injection_fig = bores.make_series_plot(
         data={
-            # "Water Injection": np.array(list(water_injection_history)),
-            "Gas Injection": np.array(list(gas_injection_history)),
+            # "Water Injection": bores.series_to_array(water_injection_history),
+            "Gas Injection": bores.series_to_array(gas_injection_history),
         },
         title="Gas Injection Analysis (CASE 3)",
         x_label="Time Step",
@@ -381,7 +381,7 @@ def _(analyst, bores, np):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     # Cumulative production & injection
     cumulative_oil_production_history = analyst.oil_production_history(
         interval=1, cumulative=True, from_step=1
@@ -389,8 +389,8 @@ def _(analyst, bores, np):
 
     cumulative_oil_production_fig = bores.make_series_plot(
         data={
-            "Cumulative Oil Production": np.array(
-                list(cumulative_oil_production_history)
+            "Cumulative Oil Production": bores.series_to_array(
+                cumulative_oil_production_history
             ),
         },
         title="Cumulative Oil Production Analysis (CASE 3)",
@@ -406,15 +406,15 @@ def _(analyst, bores, np):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     cumulative_water_production_history = analyst.water_production_history(
         interval=1, cumulative=True, from_step=1
     )
 
     cumulative_water_production_fig = bores.make_series_plot(
         data={
-            "Cumulative Water Production": np.array(
-                list(cumulative_water_production_history)
+            "Cumulative Water Production": bores.series_to_array(
+                cumulative_water_production_history
             ),
         },
         title="Cumulative Water Production Analysis (CASE 3)",
@@ -431,15 +431,15 @@ def _(analyst, bores, np):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     cumulative_gas_production_history = analyst.gas_production_history(
         interval=1, cumulative=True, from_step=1
     )
 
     cumulative_gas_production_fig = bores.make_series_plot(
         data={
-            "Cumulative Gas Production": np.array(
-                list(cumulative_gas_production_history)
+            "Cumulative Gas Production": bores.series_to_array(
+                cumulative_gas_production_history
             ),
         },
         title="Cumulative Gas Production Analysis (CASE 3)",
@@ -488,15 +488,15 @@ def _(bores, gor_history, np, water_cut_history):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     cumulative_gas_injection_history = analyst.gas_injection_history(
         interval=1, cumulative=True, from_step=1
     )
 
     cumulative_gas_injection_fig = bores.make_series_plot(
         data={
-            "Cumulative Gas Injection": np.array(
-                list(cumulative_gas_injection_history)
+            "Cumulative Gas Injection": bores.series_to_array(
+                cumulative_gas_injection_history
             ),
         },
         title="Cumulative Gas Injection Analysis (CASE 3)",
@@ -511,7 +511,7 @@ def _(analyst, bores, np):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     # Reserves
     oil_in_place_history = analyst.oil_in_place_history(interval=1, from_step=1)
     gas_in_place_history = analyst.gas_in_place_history(interval=1, from_step=1)
@@ -519,8 +519,8 @@ def _(analyst, bores, np):
 
     oil_water_reserves_fig = bores.make_series_plot(
         data={
-            "Oil In Place": np.array(list(oil_in_place_history)),
-            "Water In Place": np.array(list(water_in_place_history)),
+            "Oil In Place": bores.series_to_array(oil_in_place_history),
+            "Water In Place": bores.series_to_array(water_in_place_history),
         },
         title="Oil & Water Reserves Analysis",
         x_label="Time Step",
@@ -531,7 +531,7 @@ def _(analyst, bores, np):
     )
     gas_reserve_fig = bores.make_series_plot(
         data={
-            "Gas In Place": np.array(list(gas_in_place_history)),
+            "Gas In Place": bores.series_to_array(gas_in_place_history),
         },
         title="Gas Reserve Analysis",
         x_label="Time Step",
@@ -592,12 +592,12 @@ def _(
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     # Displacement ratios
     vrr_history = analyst.voidage_replacement_ratio_history(from_step=1, interval=1)
     vrr_fig = bores.make_series_plot(
         data={
-            "Voidage Replacement Ratio (VRR)": np.array(list(vrr_history)),
+            "Voidage Replacement Ratio (VRR)": bores.series_to_array(vrr_history),
         },
         title="Voidage Replacement Ratio (VRR) Analysis",
         x_label="Time Step",
@@ -612,7 +612,7 @@ def _(analyst, bores, np):
     )
     mobility_ratio_fig = bores.make_series_plot(
         data={
-            "Mobility Ratio (MR)": np.array(list(mobility_ratio_history)),
+            "Mobility Ratio (MR)": bores.series_to_array(mobility_ratio_history),
         },
         title="Mobility Ratio (MR) Analysis",
         x_label="Time Step",
@@ -650,7 +650,7 @@ def _(analyst, bores, np, recovery_efficiency_history):
     )
     recovery_factor_fig = bores.make_series_plot(
         data={
-            "Oil Recovery Factor": np.array(list(oil_recovery_factor_history)),
+            "Oil Recovery Factor": bores.series_to_array(oil_recovery_factor_history),
         },
         title="Recovery Factor Analysis",
         x_label="Time Step",
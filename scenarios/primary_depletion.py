@@ -9,13 +9,10 @@ def setup_run():
     import logging
     from pathlib import Path
 
-    import numpy as np
-
     import bores
 
     logging.basicConfig(level=logging.INFO)
 
-    np.set_printoptions(threshold=np.inf)  # type: ignore
     bores.use_32bit_precision()
 
     preconditioner_factory = bores.CachedPreconditionerFactory(
@@ -281,14 +281,14 @@ def _(bores, np, oil_relative_mobility_history):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     # Production & Injection
     oil_production_history = analyst.oil_production_history(
         interval=1, cumulative=False, from_step=1
     )
     oil_production_fig = bores.make_series_plot(
         data={
-            "Oil Production": np.array(list(oil_production_history)),
+            "Oil Production": bores.series_to_array(oil_production_history),
         },
         title="Oil Production Analysis (CASE 2)",
         x_label="Time Step",
@@ -302,13 +302,13 @@ def _(analyst, bores, np):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     water_production_history = analyst.water_production_history(
         interval=1, cumulative=False, from_step=1
     )
     water_production_fig = bores.make_series_plot(
         data={
-            "Water Production": np.array(list(water_production_history)),
+            "Water Production": bores.series_to_array(water_production_history),
         },
         title="Water Production Analysis (CASE 2)",
         x_label="Time Step",
@@ -322,13 +322,13 @@ def _(analyst, bores, np):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     gas_production_history = analyst.gas_production_history(
         interval=1, cumulative=False, from_step=1
     )
     gas_production_fig = bores.make_series_plot(
         data={
-            "Gas Production": np.array(list(gas_production_history)),
+            "Gas Production": bores.series_to_array(gas_production_history),
         },
         title="Gas Production Analysis (CASE 2)",
         x_label="Time Step",
@@ -342,7 +342,7 @@ def _(analyst, bores, np):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     # Cumulative production & injection
     cumulative_oil_production_history = analyst.oil_production_history(
         interval=1, cumulative=True, from_step=1
@@ -350,8 +350,8 @@ def _(analyst, bores, np):
 
     cumulative_oil_production_fig = bores.make_series_plot(
         data={
-            "Cumulative Oil Production": np.array(
-                list(cumulative_oil_production_history)
+            "Cumulative Oil Production": bores.series_to_array(
+                cumulative_oil_production_history
             ),
         },
         title="Cumulative Oil Production Analysis (CASE 2)",
@@ -367,15 +367,15 @@ def _(analyst, bores, np):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     cumulative_water_production_history = analyst.water_production_history(
         interval=1, cumulative=True, from_step=1
     )
 
     cumulative_water_production_fig = bores.make_series_plot(
         data={
-            "Cumulative Water Production": np.array(
-                list(cumulative_water_production_history)
+            "Cumulative Water Production": bores.series_to_array(
+                cumulative_water_production_history
             ),
         },
         title="Cumulative Water Production Analysis (CASE 2)",
@@ -392,15 +392,15 @@ def _(analyst, bores, np):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     cumulative_gas_production_history = analyst.gas_production_history(
         interval=1, cumulative=True, from_step=1
     )
 
     cumulative_gas_production_fig = bores.make_series_plot(
         data={
-            "Cumulative Gas Production": np.array(
-                list(cumulative_gas_production_history)
+            "Cumulative Gas Production": bores.series_to_array(
+                cumulative_gas_production_history
             ),
         },
         title="Cumulative Gas Production Analysis (CASE 2)",
@@ -449,7 +449,7 @@ def _(bores, gor_history, np, water_cut_history):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     # Reserves
     oil_in_place_history = analyst.oil_in_place_history(interval=1, from_step=1)
     gas_in_place_history = analyst.gas_in_place_history(interval=1, from_step=1)
@@ -457,8 +457,8 @@ def _(analyst, bores, np):
 
     oil_water_reserves_fig = bores.make_series_plot(
         data={
-            "Oil In Place": np.array(list(oil_in_place_history)),
-            "Water In Place": np.array(list(water_in_place_history)),
+            "Oil In Place": bores.series_to_array(oil_in_place_history),
+            "Water In Place": bores.series_to_array(water_in_place_history),
         },
         title="Oil & Water Reserves Analysis",
         x_label="Time Step",
@@ -469,7 +469,7 @@ def _(analyst, bores, np):
     )
     gas_reserve_fig = bores.make_series_plot(
         data={
-            "Gas In Place": np.array(list(gas_in_place_history)),
+            "Gas In Place": bores.series_to_array(gas_in_place_history),
         },
         title="Gas Reserve Analysis",
         x_label="Time Step",
@@ -548,7 +548,7 @@ def _(analyst, bores, np, recovery_efficiency_history):
     )
     recovery_factor_fig = bores.make_series_plot(
         data={
-            "Oil Recovery Factor": np.array(list(oil_recovery_factor_history)),
+            "Oil Recovery Factor": bores.series_to_array(oil_recovery_factor_history),
         },
         title="Recovery Factor Analysis",
         x_label="Time Step",
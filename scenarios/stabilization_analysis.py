@@ -305,7 +305,7 @@ def _(bores, np, oil_relative_mobility_history):
 
 
 @app.cell
-def _(analyst, bores, np):
+def _(analyst, bores):
     oil_in_place_history = analyst.oil_in_place_history(interval=1, from_step=1)
     gas_in_place_history = analyst.gas_in_place_history(interval=1, from_step=1)
     water_in_place_history = analyst.water_in_place_history(interval=1, from_step=1)
@@ -313,8 +313,8 @@ def _(analyst, bores, np):
     # Reserves
     oil_water_reserves_fig = bores.make_series_plot(
         data={
-            "Water In Place": np.array(list(water_in_place_history)),
-            "Oil In Place": np.array(list(oil_in_place_history)),
+            "Water In Place": bores.series_to_array(water_in_place_history),
+            "Oil In Place": bores.series_to_array(oil_in_place_history),
         },
         title="Oil & Water Reserves Stability Analysis (Case 1)",
         x_label="Time Step",
@@ -325,7 +325,7 @@ def _(analyst, bores, np):
     )
     gas_reserve_fig = bores.make_series_plot(
         data={
-            "Gas In Place": np.array(list(gas_in_place_history)),
+            "Gas In Place": bores.series_to_array(gas_in_place_history),
         },
         title="Gas Reserve Stability Analysis (Case 1)",
         x_label="Time Step",
@@ -1039,9 +1039,23 @@ class ModelAnalyst(typing.Generic[NDimension]):
         """
         to_step = self._resolve_step(to_step)
 
+        previous_step = None
         for t in range(from_step, to_step + 1, interval):
-            if t in self._states:
-                yield (t, self.oil_in_place(t))
+            if t not in self._states:
+                continue
+            # Advance from the previous sampled step rather than re-summing
+            # production from `min_step` for every step (O(N) instead of O(N^2))
+            if (
+                previous_step is not None
+                and previous_step in self._oil_in_place_cache
+                and t not in self._oil_in_place_cache
+            ):
+                self._oil_in_place_cache[t] = (
+                    self._oil_in_place_cache[previous_step]
+                    - self.oil_produced(from_step=previous_step + 1, to_step=t)
+                )
+            yield (t, self.oil_in_place(t))
+            previous_step = t
 
     def gas_in_place_history(
         self, from_step: int = 0, to_step: int = -1, interval: int = 1
@@ -1055,9 +1069,23 @@ class ModelAnalyst(typing.Generic[NDimension]):
         """
         to_step = self._resolve_step(to_step)
 
+        previous_step = None
         for t in range(from_step, to_step + 1, interval):
-            if t in self._states:
-                yield (t, self.free_gas_in_place(t))
+            if t not in self._states:
+                continue
+            # Advance from the previous sampled step (see `oil_in_place_history`)
+            if (
+                previous_step is not None
+                and previous_step in self._free_gas_in_place_cache
+                and t not in self._free_gas_in_place_cache
+            ):
+                self._free_gas_in_place_cache[t] = (
+                    self._free_gas_in_place_cache[previous_step]
+                    + self.gas_injected(from_step=previous_step + 1, to_step=t)
+                    - self.gas_produced(from_step=previous_step + 1, to_step=t)
+                )
+            yield (t, self.free_gas_in_place(t))
+            previous_step = t
 
     def water_in_place_history(
         self, from_step: int = 0, to_step: int = -1, interval: int = 1
@@ -1071,9 +1099,23 @@ class ModelAnalyst(typing.Generic[NDimension]):
         """
         to_step = self._resolve_step(to_step)
 
+        previous_step = None
         for t in range(from_step, to_step + 1, interval):
-            if t in self._states:
-                yield (t, self.water_in_place(t))
+            if t not in self._states:
+                continue
+            # Advance from the previous sampled step (see `oil_in_place_history`)
+            if (
+                previous_step is not None
+                and previous_step in self._water_in_place_cache
+                and t not in self._water_in_place_cache
+            ):
+                self._water_in_place_cache[t] = (
+                    self._water_in_place_cache[previous_step]
+                    + self.water_injected(from_step=previous_step + 1, to_step=t)
+                    - self.water_produced(from_step=previous_step + 1, to_step=t)
+                )
+            yield (t, self.water_in_place(t))
+            previous_step = t
 
     def oil_produced(
         self,
@@ -4,7 +4,6 @@ import warnings
 
 import numba  # type: ignore[import-untyped]
 import numpy as np
-from CoolProp.CoolProp import PropsSI  # type: ignore[import, import-untyped]
 from scipy.optimize import brentq  # type: ignore[import-untyped]
 
 from bores.constants import c
@@ -12,6 +11,7 @@ from bores.correlations import fahrenheit_to_rankine
 from bores.correlations.core import (
     HENRY_COEFFICIENTS,
     SETSCHENOW_CONSTANTS,
+    PropsSI,
     _get_gas_symbol,
     clip_pressure,
     clip_temperature,
@@ -7,7 +7,6 @@ import warnings
 
 import numba  # type: ignore[import-untyped]
 import numpy as np
-from CoolProp.CoolProp import PropsSI  # type: ignore[import, import-untyped]
 from scipy.optimize import brentq, root_scalar  # type: ignore[import-untyped]
 
 from bores.constants import c
@@ -31,6 +30,23 @@ __all__ = [
 ]
 
 
+@functools.cache
+def _load_PropsSI() -> typing.Callable[..., typing.Any]:
+    from CoolProp.CoolProp import PropsSI  # type: ignore[import, import-untyped]
+
+    return PropsSI
+
+
+def PropsSI(*args: typing.Any) -> typing.Any:
+    """
+    Proxy to `CoolProp.CoolProp.PropsSI`.
+
+    CoolProp takes seconds to import and is only needed for EOS-based fluid
+    properties, so it is imported on first call rather than with the package.
+    """
+    return _load_PropsSI()(*args)
+
+
 def validate_input_temperature(temperature: FloatOrArray) -> None:
     """
     Validates that the input temperature(s) are within valid/reservoir-like range.
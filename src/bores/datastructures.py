@@ -976,7 +976,9 @@ class Rates(Serializable, typing.Generic[DType, ShapeT]):
         :returns: A new `SparseTensor[DType, ShapeT]` of summed rates, or
             None if all phases are absent.
         """
-        return self.oil + self.water + self.gas
+        total = self.oil + self.water
+        total += self.gas  # Accumulate into the new tensor instead of copying again
+        return total
 
     def __iter__(self) -> typing.Iterator[SparseTensor[DType, ShapeT]]:
         yield self.water
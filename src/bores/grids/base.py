@@ -35,6 +35,10 @@ def array(obj: typing.Any, **kwargs: typing.Any):
     :param kwargs: Additional keyword arguments for `np.array`
     :return: return value of `np.array`
     """
+    if not kwargs:
+        # Forwarding even an empty `**kwargs` to `np.array` costs about as much
+        # as converting a small sequence, so skip it in the common case
+        return np.array(obj, dtype=get_dtype())
     kwargs.setdefault("dtype", get_dtype())
     return np.array(obj, **kwargs)
 
@@ -85,52 +89,39 @@ def build_layered_grid(
     orientation = (
         Orientation(orientation) if isinstance(orientation, str) else orientation
     )
-    dtype = get_dtype()
-    layered_grid = build_uniform_grid(grid_shape=grid_shape, value=0.0)
     if orientation == Orientation.X:  # Layering along x-axis
-        if len(layer_values) != grid_shape[0]:
-            raise ValidationError(
-                "Number of layer values must match number of cells in x direction."
-            )
-
-        for i, layer_value in enumerate(layer_values):
-            layered_grid[i, :, :] = layer_value
-        return layered_grid.astype(dtype, copy=False)
-
+        axis = 0
     elif orientation == Orientation.Y:  # Layering along y-axis
-        if len(layer_values) != grid_shape[1]:
-            raise ValidationError(
-                "Number of layer values must match number of cells in y direction."
-            )
-
-        for j, layer_value in enumerate(layer_values):
-            layered_grid[:, j, :] = layer_value
-        return layered_grid.astype(dtype, copy=False)
-
+        axis = 1
     elif orientation == Orientation.Z:  # Layering along z-axis
         if len(grid_shape) != 3:
             raise ValidationError(
                 "Grid dimension must be N-Dimensional for z-direction layering."
             )
+        axis = 2
+    else:
+        raise ValidationError(
+            "Invalid layering direction. Must be one of 'x', 'y', or 'z'."
+        )
 
-        if len(layer_values) != grid_shape[2]:
-            raise ValidationError(
-                "Number of layer values must match number of cells in z direction."
-            )
-
-        for k, layer_value in enumerate(layer_values):
-            layered_grid[:, :, k] = layer_value
-        return layered_grid.astype(dtype, copy=False)
+    if len(layer_values) != grid_shape[axis]:
+        raise ValidationError(
+            f"Number of layer values must match number of cells in {orientation.value} direction."
+        )
 
-    raise ValidationError(
-        "Invalid layering direction. Must be one of 'x', 'y', or 'z'."
-    )
+    # Lay the values out along the layering axis so one assignment broadcasts them over the grid
+    dtype = get_dtype()
+    layer_shape = [1] * len(grid_shape)
+    layer_shape[axis] = -1
+    layered_grid = np.empty(grid_shape, dtype=dtype, order="C")
+    layered_grid[...] = np.asarray(layer_values, dtype=dtype).reshape(layer_shape)
+    return layered_grid
 
 
 layered_grid = build_layered_grid  # Alias for convenience
 
 
-@numba.njit(cache=True)
+@numba.njit(parallel=True, cache=True)
 def _compute_elevation_downward(
     thickness_grid: NDimensionalGrid[NDimension],
     dtype: npt.DTypeLike,
@@ -139,27 +130,30 @@ def _compute_elevation_downward(
     """
     Compute elevation grid in downward direction (depth from top).
 
+    Each (i,j) column is accumulated independently along z, which is the
+    contiguous axis, so columns are processed in parallel.
+
     :param thickness_grid: 3D array of cell thicknesses (ft)
     :param dtype: NumPy dtype for array allocation
     :param datum: Reference elevation/depth for the bottom/top of the grid (ft).
     :return: 3D elevation grid (ft)
     """
-    _, _, nz = thickness_grid.shape
-    elevation_grid = np.zeros_like(thickness_grid, dtype=dtype)
-
-    # Start from top layer
-    elevation_grid[:, :, 0] = thickness_grid[:, :, 0] / 2
-    for k in range(1, nz):
-        elevation_grid[:, :, k] = (
-            elevation_grid[:, :, k - 1]
-            + thickness_grid[:, :, k - 1] / 2
-            + thickness_grid[:, :, k] / 2
-        )
+    nx, ny, nz = thickness_grid.shape
+    elevation_grid = np.empty((nx, ny, nz), dtype=dtype)
+
+    for i in numba.prange(nx):  # type: ignore  # Parallel outer loop
+        for j in range(ny):
+            # Start from top layer
+            depth_to_top = 0.0
+            for k in range(nz):
+                thickness = thickness_grid[i, j, k]
+                elevation_grid[i, j, k] = depth_to_top + thickness / 2 + datum
+                depth_to_top += thickness
 
-    return elevation_grid + datum  # type: ignore
+    return elevation_grid  # type: ignore
 
 
-@numba.njit(cache=True)
+@numba.njit(parallel=True, cache=True)
 def _compute_elevation_upward(
     thickness_grid: NDimensionalGrid[NDimension],
     dtype: npt.DTypeLike,
@@ -168,24 +162,27 @@ def _compute_elevation_upward(
     """
     Compute elevation grid in upward direction (elevation from bottom).
 
+    Each (i,j) column is accumulated independently along z, which is the
+    contiguous axis, so columns are processed in parallel.
+
     :param thickness_grid: 3D array of cell thicknesses (ft)
     :param dtype: NumPy dtype for array allocation
     :param datum: Reference elevation/depth for the bottom/top of the grid (ft).
     :return: 3D elevation grid (ft)
     """
-    _, _, nz = thickness_grid.shape
-    elevation_grid = np.zeros_like(thickness_grid, dtype=dtype)
-
-    # Start from bottom layer
-    elevation_grid[:, :, -1] = thickness_grid[:, :, -1] / 2
-    for k in range(nz - 2, -1, -1):
-        elevation_grid[:, :, k] = (
-            elevation_grid[:, :, k + 1]
-            + thickness_grid[:, :, k + 1] / 2
-            + thickness_grid[:, :, k] / 2
-        )
+    nx, ny, nz = thickness_grid.shape
+    elevation_grid = np.empty((nx, ny, nz), dtype=dtype)
+
+    for i in numba.prange(nx):  # type: ignore  # Parallel outer loop
+        for j in range(ny):
+            # Start from bottom layer
+            height_to_bottom = 0.0
+            for k in range(nz - 1, -1, -1):
+                thickness = thickness_grid[i, j, k]
+                elevation_grid[i, j, k] = height_to_bottom + thickness / 2 + datum
+                height_to_bottom += thickness
 
-    return elevation_grid + datum  # type: ignore
+    return elevation_grid  # type: ignore
 
 
 def _build_elevation_grid(
@@ -211,6 +208,14 @@ def _build_elevation_grid(
 
     dtype = get_dtype()
 
+    # A single layer has nothing to accumulate; both directions put the cell
+    # center half a thickness from the datum.
+    if thickness_grid.shape[-1] == 1:
+        elevation_grid = np.array(thickness_grid, dtype=dtype)
+        elevation_grid *= 0.5
+        elevation_grid += datum
+        return elevation_grid  # type: ignore[return-value]
+
     if direction == "downward":
         return _compute_elevation_downward(thickness_grid, dtype=dtype, datum=datum)
     return _compute_elevation_upward(thickness_grid, dtype=dtype, datum=datum)
@@ -341,16 +346,17 @@ def _apply_dip_upward(
     cell_size_x, cell_size_y = cell_dimensions
     dx_component, dy_component, tan_dip_angle = dip_components
 
+    nz = dipped_elevation_grid.shape[2]
     for i in numba.prange(nx):  # type: ignore  # Parallel outer loop
+        x_distance = i * cell_size_x
+        x_along_dip = x_distance * dx_component
         for j in range(ny):
-            x_distance = i * cell_size_x
             y_distance = j * cell_size_y
-            distance_along_dip = (x_distance * dx_component) + (
-                y_distance * dy_component
-            )
+            distance_along_dip = x_along_dip + (y_distance * dy_component)
             dip_offset = distance_along_dip * tan_dip_angle
             # Upward: moving in dip direction decreases elevation
-            dipped_elevation_grid[i, j, :] -= dip_offset
+            for k in range(nz):
+                dipped_elevation_grid[i, j, k] -= dip_offset
 
     return dipped_elevation_grid
 
@@ -377,16 +383,17 @@ def _apply_dip_downward(
     cell_size_x, cell_size_y = cell_dimensions
     dx_component, dy_component, tan_dip_angle = dip_components
 
+    nz = dipped_elevation_grid.shape[2]
     for i in numba.prange(nx):  # type: ignore  # Parallel outer loop
+        x_distance = i * cell_size_x
+        x_along_dip = x_distance * dx_component
         for j in range(ny):
-            x_distance = i * cell_size_x
             y_distance = j * cell_size_y
-            distance_along_dip = (x_distance * dx_component) + (
-                y_distance * dy_component
-            )
+            distance_along_dip = x_along_dip + (y_distance * dy_component)
             dip_offset = distance_along_dip * tan_dip_angle
             # Downward: moving in dip direction increases depth
-            dipped_elevation_grid[i, j, :] += dip_offset
+            for k in range(nz):
+                dipped_elevation_grid[i, j, k] += dip_offset
 
     return dipped_elevation_grid
 
@@ -447,7 +454,12 @@ def apply_structural_dip(
         raise ValidationError("`dip_azimuth` must be between 0 and 360 degrees")
 
     dtype = get_dtype()
-    dipped_elevation_grid = elevation_grid.copy().astype(dtype, copy=False)
+    # Single copy into the working dtype; the dip kernels modify it in-place
+    dipped_elevation_grid = np.array(elevation_grid, dtype=dtype, order="C")
+    if dip_angle == 0.0:
+        # A flat surface has no dip offset to add
+        return dipped_elevation_grid  # type: ignore[return-value]
+
     dip_angle_radians = np.radians(dip_angle, dtype=dtype)
     dip_azimuth_radians = np.radians(dip_azimuth, dtype=dtype)
 
@@ -49,7 +49,6 @@ def pad_grid(
     return np.pad(grid, pad_width=pad_width, mode="edge")  # type: ignore[return-value]
 
 
-@numba.njit(cache=True)
 def get_pad_mask(grid_shape: typing.Tuple[int, ...], pad_width: int = 1) -> np.ndarray:
     """
     Generate a boolean mask for the padded grid indicating the padded regions.
@@ -59,46 +58,46 @@ def get_pad_mask(grid_shape: typing.Tuple[int, ...], pad_width: int = 1) -> np.n
     :return: Boolean mask numpy array where True indicates padded regions
     """
     padded_shape = tuple(dim + 2 * pad_width for dim in grid_shape)
-    mask = np.zeros(padded_shape, dtype=bool)
-
-    # Set padded regions to True
-    slices = tuple(
-        slice(0, pad_width)
-        if i == 0
-        else slice(-pad_width, None)
-        if i == 1
-        else slice(pad_width, -pad_width)
-        for i, _ in enumerate(padded_shape)
-    )
-    mask[slices] = True
+    mask = np.ones(padded_shape, dtype=bool)
+
+    # Clear the core (original grid) region, leaving only the padding set
+    core = tuple(slice(pad_width, pad_width + dim) for dim in grid_shape)
+    mask[core] = False
     return mask
 
 
-@numba.njit(cache=True)
 def unpad_grid(
     grid: NDimensionalGrid[NDimension], pad_width: int = 1
 ) -> NDimensionalGrid[NDimension]:
     """
     Remove padding from a N-Dimensional grid.
 
+    The result is a view into `grid`, not a copy. Copy it if the padded grid
+    will be modified while the unpadded grid is still in use.
+
     :param grid: Padded N-Dimensional numpy array representing the grid
     :param pad_width: Width of the padding to be removed from all sides of the grid
-    :return: N-Dimensional numpy array with padding removed
+    :return: N-Dimensional numpy array (view) with padding removed
     """
-    # Build slices list explicitly (generator expressions not supported in Numba)
-    ndim = grid.ndim
-    if ndim == 2:
-        unpadded_grid = grid[pad_width:-pad_width, pad_width:-pad_width]
-    elif ndim == 3:
-        unpadded_grid = grid[
-            pad_width:-pad_width, pad_width:-pad_width, pad_width:-pad_width
-        ]
-    else:
-        raise ValueError(
-            f"Unsupported grid dimension: {ndim}. Only 2D and 3D grids are supported."
-        )
-
-    return unpadded_grid  # type: ignore
+    core = tuple(slice(pad_width, dim - pad_width) for dim in grid.shape)
+    return grid[core]  # type: ignore[return-value]
+
+
+# Aggregation codes for `_coarsen_blocks`
+_COARSEN_MEAN = 0
+_COARSEN_SUM = 1
+_COARSEN_MAX = 2
+_COARSEN_MIN = 3
+_COARSEN_HARMONIC = 4
+
+_COARSEN_METHODS = {
+    "mean": _COARSEN_MEAN,
+    "sum": _COARSEN_SUM,
+    "max": _COARSEN_MAX,
+    "min": _COARSEN_MIN,
+    "harmonic": _COARSEN_HARMONIC,
+}
+"""Aggregation code for each `coarsen_grid` method."""
 
 
 def coarsen_grid(
@@ -110,7 +109,8 @@ def coarsen_grid(
     """
     Coarsen (downsample) a 2D or 3D grid by aggregating blocks of adjacent cells.
 
-    Pads the grid if necessary to make dimensions divisible by `batch_size`.
+    Dimensions that are not divisible by `batch_size` leave partial blocks at the
+    trailing edges, which are aggregated over the cells they contain.
 
     :param data: 2D or 3D numpy array to coarsen. Shape can be (nx, ny) or (nx, ny, nz).
     :param batch_size: Tuple of ints representing the coarsening factor along each dimension.
@@ -151,80 +151,99 @@ def coarsen_grid(
         )
 
     # Validate method
-    valid_methods = ("mean", "sum", "max", "min", "harmonic")
-    if method not in valid_methods:
+    if method not in _COARSEN_METHODS:
         raise ValidationError(
-            f"Unsupported method '{method}'. Must be one of {valid_methods}"
+            f"Unsupported method '{method}'. Must be one of {tuple(_COARSEN_METHODS)}"
         )
 
-    # Calculate padding needed
-    pad_width = []
-    for dim, b in zip(data.shape, batch_size):
-        remainder = dim % b
-        if remainder == 0:
-            pad_width.append((0, 0))
-        else:
-            pad_width.append((0, b - remainder))
-
-    # Pad with appropriate value based on method
-    # Use NaN for methods that support it (will be ignored in aggregation)
-    if method in ("mean", "max", "min", "harmonic"):
-        pad_value = np.nan
-    elif method == "sum":
-        pad_value = 0.0
-
-    data_padded = np.pad(
-        data, pad_width=pad_width, mode="constant", constant_values=pad_value
-    )
-
-    # Reshape to group blocks along each dimension
-    # E.g., (100, 50) with batch (2, 5) -> (50, 2, 10, 5) -> aggregate over axes (1, 3)
-    reshape_shape = []
-    for dim, b in zip(data_padded.shape, batch_size):
-        reshape_shape.extend([dim // b, b])
-
-    data_reshaped = data_padded.reshape(reshape_shape)
-
-    # Axes to aggregate over: every second axis (the block dimensions)
-    agg_axes = tuple(range(1, data_reshaped.ndim, 2))
-
-    dtype = get_dtype()
-
-    # Apply aggregation
-    if method == "mean":
-        coarsened = np.nanmean(data_reshaped, axis=agg_axes).astype(dtype)
-
-    elif method == "sum":
-        coarsened = data_reshaped.sum(axis=agg_axes, dtype=dtype)
-
-    elif method == "max":
-        coarsened = np.nanmax(data_reshaped, axis=agg_axes).astype(dtype)
-
-    elif method == "min":
-        coarsened = np.nanmin(data_reshaped, axis=agg_axes).astype(dtype)
-
-    elif method == "harmonic":
-        # Harmonic mean: H = n / sum(1/x_i)
-        # Add epsilon to avoid division by zero
-        with np.errstate(divide="ignore", invalid="ignore"):
-            reciprocals = 1.0 / (data_reshaped + epsilon)
-            reciprocals = np.where(np.isnan(data_reshaped), np.nan, reciprocals)
-
-            # Count non-NaN values per block
-            counts = np.sum(~np.isnan(data_reshaped), axis=agg_axes)
-
-            # Sum of reciprocals, ignoring NaNs
-            sum_reciprocals = np.nansum(reciprocals, axis=agg_axes)
-
-            # Harmonic mean = n / sum(1/x)
-            coarsened = counts / sum_reciprocals
-
-            # Handle edge cases
-            coarsened = np.where(counts == 0, np.nan, coarsened)
-            coarsened = np.where(np.isinf(coarsened), 0.0, coarsened)
-            coarsened = coarsened.astype(dtype)
-
-    return coarsened
+    if data.ndim not in (2, 3):
+        raise ValidationError(f"Expected a 2D or 3D grid, got {data.ndim}D")
+
+    # Reduce every block in a single parallel pass. Blocks are clipped at the
+    # grid edges instead of padding, which matches padding with NaN (or 0 for
+    # 'sum'), so no padded copy of the grid is needed.
+    grid = data.reshape(data.shape + (1,) * (3 - data.ndim))
+    block_size = tuple(batch_size) + (1,) * (3 - data.ndim)
+    coarse_shape = tuple(-(-dim // b) for dim, b in zip(grid.shape, block_size))
+    coarsened = np.empty(coarse_shape, dtype=get_dtype())
+    _coarsen_blocks(grid, *block_size, _COARSEN_METHODS[method], epsilon, coarsened)
+    return coarsened.reshape(coarse_shape[: data.ndim])
+
+
+@numba.njit(parallel=True, cache=True)
+def _coarsen_blocks(
+    data: ThreeDimensionalGrid,
+    bx: int,
+    by: int,
+    bz: int,
+    method: int,
+    epsilon: float,
+    out: ThreeDimensionalGrid,
+) -> None:
+    """
+    Aggregate each `(bx, by, bz)` block of `data` into `out`.
+
+    Cells beyond the edge of `data` are ignored. NaN cells are ignored by all
+    methods except 'sum', where they propagate. Blocks with no valid cells are
+    NaN, and blocks whose harmonic mean is infinite are 0.
+
+    :param data: 3D input array
+    :param bx: Block size in x
+    :param by: Block size in y
+    :param bz: Block size in z
+    :param method: One of the `_COARSEN_*` aggregation codes
+    :param epsilon: Small value added to each cell value to avoid division by zero
+        in the harmonic mean
+    :param out: 3D output array of shape `ceil(data.shape / (bx, by, bz))`
+    """
+    nx, ny, nz = data.shape
+    ncx, ncy, ncz = out.shape
+    for ci in numba.prange(ncx):  # type: ignore
+        for cj in range(ncy):
+            for ck in range(ncz):
+                count = 0
+                total = 0.0
+                extreme = 0.0
+                for i in range(ci * bx, min((ci + 1) * bx, nx)):
+                    for j in range(cj * by, min((cj + 1) * by, ny)):
+                        for k in range(ck * bz, min((ck + 1) * bz, nz)):
+                            value = data[i, j, k]
+                            if np.isnan(value):
+                                if method == _COARSEN_SUM:
+                                    total += value
+                                continue
+
+                            count += 1
+                            if method == _COARSEN_HARMONIC:
+                                denominator = value + epsilon
+                                if denominator == 0.0:
+                                    total += np.inf
+                                else:
+                                    total += 1.0 / denominator
+                            elif method == _COARSEN_MAX:
+                                if count == 1 or value > extreme:
+                                    extreme = value
+                            elif method == _COARSEN_MIN:
+                                if count == 1 or value < extreme:
+                                    extreme = value
+                            else:
+                                total += value
+
+                if method == _COARSEN_SUM:
+                    out[ci, cj, ck] = total
+                elif count == 0:
+                    out[ci, cj, ck] = np.nan
+                elif method == _COARSEN_MEAN:
+                    out[ci, cj, ck] = total / count
+                elif method == _COARSEN_HARMONIC:
+                    # Harmonic mean = n / sum(1/x)
+                    if total == 0.0:
+                        out[ci, cj, ck] = 0.0
+                    else:
+                        result = count / total
+                        out[ci, cj, ck] = 0.0 if np.isinf(result) else result
+                else:
+                    out[ci, cj, ck] = extreme
 
 
 def _coarsen_2d_permeability_grids(
@@ -287,56 +306,12 @@ def _coarsen_2d_permeability_grids(
         raise ValidationError(f"batch_size elements must be >= 1, got ({bx}, {by})")
 
     nx, ny = kx.shape
-
-    # Compute padding
-    pad_x = (bx - nx % bx) % bx
-    pad_y = (by - ny % by) % by
-
-    # Pad grids with NaN
-    if pad_x > 0 or pad_y > 0:
-        kx_padded = np.pad(
-            kx, ((0, pad_x), (0, pad_y)), mode="constant", constant_values=np.nan
-        )
-        ky_padded = np.pad(
-            ky, ((0, pad_x), (0, pad_y)), mode="constant", constant_values=np.nan
-        )
-    else:
-        kx_padded = kx
-        ky_padded = ky
-
-    nx_new, ny_new = kx_padded.shape
-    nx_coarse = nx_new // bx
-    ny_coarse = ny_new // by
+    coarse_shape = (-(-nx // bx), -(-ny // by))
 
     dtype = get_dtype()
-
-    # Initialize output arrays
-    kx_coarse = np.zeros((nx_coarse, ny_coarse), dtype=dtype)
-    ky_coarse = np.zeros((nx_coarse, ny_coarse), dtype=dtype)
-
-    # Coarsen k_x: harmonic in x, arithmetic in y
-    for i in range(nx_coarse):
-        for j in range(ny_coarse):
-            # Extract block
-            block_kx = kx_padded[i * bx : (i + 1) * bx, j * by : (j + 1) * by]
-
-            # First, take harmonic mean along x-direction (axis=0)
-            kx_harmonic_x = _axis_harmonic_mean(block_kx, axis=0, epsilon=epsilon)
-
-            # Then, take arithmetic mean along y-direction
-            kx_coarse[i, j] = np.nanmean(kx_harmonic_x)
-
-    # Coarsen k_y: harmonic in y, arithmetic in x
-    for i in range(nx_coarse):
-        for j in range(ny_coarse):
-            # Extract block
-            block_ky = ky_padded[i * bx : (i + 1) * bx, j * by : (j + 1) * by]
-
-            # First, take harmonic mean along y-direction (axis=1)
-            ky_harmonic_y = _axis_harmonic_mean(block_ky, axis=1, epsilon=epsilon)
-
-            # Then, take arithmetic mean along x-direction
-            ky_coarse[i, j] = np.nanmean(ky_harmonic_y)
+    kx_coarse = np.empty(coarse_shape, dtype=dtype)
+    ky_coarse = np.empty(coarse_shape, dtype=dtype)
+    _coarsen_2d_permeability_blocks(kx, ky, bx, by, epsilon, kx_coarse, ky_coarse)
 
     return kx_coarse, ky_coarse
 
@@ -410,108 +385,172 @@ def _coarsen_3d_permeability_grids(
         )
 
     nx, ny, nz = kx.shape
-
-    # Compute padding
-    pad_x = (bx - nx % bx) % bx
-    pad_y = (by - ny % by) % by
-    pad_z = (bz - nz % bz) % bz
-
-    # Pad grids with NaN
-    if pad_x > 0 or pad_y > 0 or pad_z > 0:
-        pad_width = ((0, pad_x), (0, pad_y), (0, pad_z))
-        kx_padded = np.pad(kx, pad_width, mode="constant", constant_values=np.nan)
-        ky_padded = np.pad(ky, pad_width, mode="constant", constant_values=np.nan)
-        kz_padded = np.pad(kz, pad_width, mode="constant", constant_values=np.nan)
-    else:
-        kx_padded = kx
-        ky_padded = ky
-        kz_padded = kz
-
-    nx_new, ny_new, nz_new = kx_padded.shape
-    nx_coarse = nx_new // bx
-    ny_coarse = ny_new // by
-    nz_coarse = nz_new // bz
+    coarse_shape = (-(-nx // bx), -(-ny // by), -(-nz // bz))
 
     dtype = get_dtype()
-
-    # Initialize output arrays
-    kx_coarse = np.zeros((nx_coarse, ny_coarse, nz_coarse), dtype=dtype)
-    ky_coarse = np.zeros((nx_coarse, ny_coarse, nz_coarse), dtype=dtype)
-    kz_coarse = np.zeros((nx_coarse, ny_coarse, nz_coarse), dtype=dtype)
-
-    # Coarsen k_x: harmonic in x, arithmetic in y and z
-    for i in range(nx_coarse):
-        for j in range(ny_coarse):
-            for k in range(nz_coarse):
-                # Extract block
-                block_kx = kx_padded[
-                    i * bx : (i + 1) * bx, j * by : (j + 1) * by, k * bz : (k + 1) * bz
-                ]
-
-                # Harmonic mean in x (axis=0), then arithmetic in y and z
-                kx_harmonic_x = _axis_harmonic_mean(block_kx, axis=0, epsilon=epsilon)
-                kx_coarse[i, j, k] = np.nanmean(kx_harmonic_x)
-
-    # Coarsen k_y: harmonic in y, arithmetic in x and z
-    for i in range(nx_coarse):
-        for j in range(ny_coarse):
-            for k in range(nz_coarse):
-                # Extract block
-                block_ky = ky_padded[
-                    i * bx : (i + 1) * bx, j * by : (j + 1) * by, k * bz : (k + 1) * bz
-                ]
-
-                # Harmonic mean in y (axis=1), then arithmetic in x and z
-                ky_harmonic_y = _axis_harmonic_mean(block_ky, axis=1, epsilon=epsilon)
-                ky_coarse[i, j, k] = np.nanmean(ky_harmonic_y)
-
-    # Coarsen k_z: harmonic in z, arithmetic in x and y
-    for i in range(nx_coarse):
-        for j in range(ny_coarse):
-            for k in range(nz_coarse):
-                # Extract block
-                block_kz = kz_padded[
-                    i * bx : (i + 1) * bx, j * by : (j + 1) * by, k * bz : (k + 1) * bz
-                ]
-
-                # Harmonic mean in z (axis=2), then arithmetic in x and y
-                kz_harmonic_z = _axis_harmonic_mean(block_kz, axis=2, epsilon=epsilon)
-                kz_coarse[i, j, k] = np.nanmean(kz_harmonic_z)
-
+    kx_coarse = np.empty(coarse_shape, dtype=dtype)
+    ky_coarse = np.empty(coarse_shape, dtype=dtype)
+    kz_coarse = np.empty(coarse_shape, dtype=dtype)
+    _coarsen_3d_permeability_blocks(
+        kx, ky, kz, bx, by, bz, epsilon, kx_coarse, ky_coarse, kz_coarse
+    )
     return kx_coarse, ky_coarse, kz_coarse
 
 
-def _axis_harmonic_mean(
-    data: npt.NDArray, axis: int, epsilon: float = 1e-10
-) -> npt.NDArray:
+@numba.njit(cache=True)
+def _directional_block_mean(
+    grid: ThreeDimensionalGrid,
+    a_start: int,
+    a_stop: int,
+    b_start: int,
+    b_stop: int,
+    c_start: int,
+    c_stop: int,
+    epsilon: float,
+) -> float:
     """
-    Compute harmonic mean along a specific axis, handling NaN values.
+    Harmonic mean along the first axis of a block, then the arithmetic mean of
+    those harmonic means over the other two axes, ignoring NaN.
+
+    This is the Cardwell-Parsons average for flow along the first axis of `grid`.
+
+    :param grid: 3D array whose first axis is the flow direction
+    :param a_start: Start of the block along the flow axis
+    :param a_stop: End (exclusive) of the block along the flow axis
+    :param b_start: Start of the block along the second axis
+    :param b_stop: End (exclusive) of the block along the second axis
+    :param c_start: Start of the block along the third axis
+    :param c_stop: End (exclusive) of the block along the third axis
+    :param epsilon: Small value to avoid division by zero
+    :return: Averaged value for the block, or NaN if the block has no valid cells
+    """
+    total = 0.0
+    count = 0
+    for b in range(b_start, b_stop):
+        for c in range(c_start, c_stop):
+            # Harmonic mean = n / sum(1/x) along the flow axis
+            n = 0
+            sum_reciprocals = 0.0
+            for a in range(a_start, a_stop):
+                value = grid[a, b, c]
+                if np.isnan(value):
+                    continue
+                n += 1
+                denominator = value + epsilon
+                if denominator == 0.0:
+                    sum_reciprocals += np.inf
+                else:
+                    sum_reciprocals += 1.0 / denominator
+
+            if n == 0:
+                continue
+
+            denominator = sum_reciprocals + epsilon
+            harmonic = 0.0 if denominator == 0.0 else n / denominator
+            total += 0.0 if np.isinf(harmonic) else harmonic
+            count += 1
+
+    if count == 0:
+        return np.nan
+    return total / count
+
+
+@numba.njit(parallel=True, cache=True)
+def _coarsen_2d_permeability_blocks(
+    kx: TwoDimensionalGrid,
+    ky: TwoDimensionalGrid,
+    bx: int,
+    by: int,
+    epsilon: float,
+    kx_coarse: TwoDimensionalGrid,
+    ky_coarse: TwoDimensionalGrid,
+) -> None:
+    """
+    Coarsen both 2D permeability grids in one parallel pass over the coarse cells.
 
-    Harmonic mean: H = n / sum(1/x_i) where n = count of non-NaN values
+    Blocks are clipped at the grid edges, which matches padding with NaN.
 
-    :param data: Input array
-    :param axis: Axis along which to compute harmonic mean
-    :param epsilon: Small value added to denominator to avoid division by zero
-    :return: Array with harmonic mean computed along specified axis
+    :param kx: X-direction permeability grid (mD)
+    :param ky: Y-direction permeability grid (mD)
+    :param bx: Block size in x
+    :param by: Block size in y
+    :param epsilon: Small value to avoid division by zero
+    :param kx_coarse: Output for the coarsened x-direction permeability
+    :param ky_coarse: Output for the coarsened y-direction permeability
     """
-    with np.errstate(divide="ignore", invalid="ignore"):
-        # Compute reciprocals, preserving NaN
-        reciprocals = np.where(np.isnan(data), np.nan, 1.0 / (data + epsilon))
-
-        # Count non-NaN values along axis
-        counts = np.sum(~np.isnan(data), axis=axis)
+    nx, ny = kx.shape
+    ncx, ncy = kx_coarse.shape
+    # 3D views (unit third axis) with each grid's flow direction as the first axis
+    kx_xy = kx[:, :, np.newaxis]
+    ky_yx = ky.T[:, :, np.newaxis]
+
+    for ci in numba.prange(ncx):  # type: ignore
+        i_start = ci * bx
+        i_stop = min(i_start + bx, nx)
+        for cj in range(ncy):
+            j_start = cj * by
+            j_stop = min(j_start + by, ny)
+            kx_coarse[ci, cj] = _directional_block_mean(
+                kx_xy, i_start, i_stop, j_start, j_stop, 0, 1, epsilon
+            )
+            ky_coarse[ci, cj] = _directional_block_mean(
+                ky_yx, j_start, j_stop, i_start, i_stop, 0, 1, epsilon
+            )
 
-        # Sum reciprocals, ignoring NaN
-        sum_reciprocals = np.nansum(reciprocals, axis=axis)
 
-        # Harmonic mean = n / sum(1/x)
-        result = counts / (sum_reciprocals + epsilon)
+@numba.njit(parallel=True, cache=True)
+def _coarsen_3d_permeability_blocks(
+    kx: ThreeDimensionalGrid,
+    ky: ThreeDimensionalGrid,
+    kz: ThreeDimensionalGrid,
+    bx: int,
+    by: int,
+    bz: int,
+    epsilon: float,
+    kx_coarse: ThreeDimensionalGrid,
+    ky_coarse: ThreeDimensionalGrid,
+    kz_coarse: ThreeDimensionalGrid,
+) -> None:
+    """
+    Coarsen all three permeability grids in one parallel pass over the coarse cells.
 
-        # Handle edge cases
-        result = np.where(counts == 0, np.nan, result)
-        result = np.where(np.isinf(result), 0.0, result)
+    Blocks are clipped at the grid edges, which matches padding with NaN.
 
-    return result
+    :param kx: X-direction permeability grid (mD)
+    :param ky: Y-direction permeability grid (mD)
+    :param kz: Z-direction permeability grid (mD)
+    :param bx: Block size in x
+    :param by: Block size in y
+    :param bz: Block size in z
+    :param epsilon: Small value to avoid division by zero
+    :param kx_coarse: Output for the coarsened x-direction permeability
+    :param ky_coarse: Output for the coarsened y-direction permeability
+    :param kz_coarse: Output for the coarsened z-direction permeability
+    """
+    nx, ny, nz = kx.shape
+    ncx, ncy, ncz = kx_coarse.shape
+    # Views with each grid's flow direction as the first axis
+    ky_yxz = ky.transpose((1, 0, 2))
+    kz_zxy = kz.transpose((2, 0, 1))
+
+    for ci in numba.prange(ncx):  # type: ignore
+        i_start = ci * bx
+        i_stop = min(i_start + bx, nx)
+        for cj in range(ncy):
+            j_start = cj * by
+            j_stop = min(j_start + by, ny)
+            for ck in range(ncz):
+                k_start = ck * bz
+                k_stop = min(k_start + bz, nz)
+                kx_coarse[ci, cj, ck] = _directional_block_mean(
+                    kx, i_start, i_stop, j_start, j_stop, k_start, k_stop, epsilon
+                )
+                ky_coarse[ci, cj, ck] = _directional_block_mean(
+                    ky_yxz, j_start, j_stop, i_start, i_stop, k_start, k_stop, epsilon
+                )
+                kz_coarse[ci, cj, ck] = _directional_block_mean(
+                    kz_zxy, k_start, k_stop, i_start, i_stop, j_start, j_stop, epsilon
+                )
 
 
 def coarsen_permeability_grids(
@@ -586,6 +625,44 @@ FlattenStrategy = typing.Union[
 ]
 
 
+@numba.njit(parallel=True, cache=True)
+def _weighted_column_mean(
+    grid: ThreeDimensionalGrid,
+    weights: ThreeDimensionalGrid,
+    ignore_nan: bool,
+    out: TwoDimensionalGrid,
+) -> None:
+    """
+    Weighted mean of each (i, j) column, `sum(w * x) / sum(w)`, written into `out`.
+
+    With `ignore_nan`, NaN products are left out of the numerator and NaN weights
+    out of the denominator; otherwise NaN propagates. Columns whose weights sum
+    to zero are NaN.
+
+    :param grid: 3D grid of values
+    :param weights: 3D grid of weights, same shape as `grid`
+    :param ignore_nan: Whether to skip NaN entries
+    :param out: 2D output array of shape `(nx, ny)`
+    """
+    nx, ny, nz = grid.shape
+    for i in numba.prange(nx):  # type: ignore
+        for j in range(ny):
+            weighted_sum = 0.0
+            weight_sum = 0.0
+            for k in range(nz):
+                weight = weights[i, j, k]
+                weighted_value = weight * grid[i, j, k]
+                if not ignore_nan or not np.isnan(weighted_value):
+                    weighted_sum += weighted_value
+                if not ignore_nan or not np.isnan(weight):
+                    weight_sum += weight
+
+            if weight_sum == 0.0:
+                out[i, j] = np.nan
+            else:
+                out[i, j] = weighted_sum / weight_sum
+
+
 def flatten_multilayer_grid_to_surface(
     multilayer_grid: ThreeDimensionalGrid,
     strategy: FlattenStrategy = "max",
@@ -666,39 +743,28 @@ def flatten_multilayer_grid_to_surface(
                 f"`weights` shape {weights.shape} must match `multilayer_grid` shape {multilayer_grid.shape}"
             )
 
-        # Weighted average: sum(w * x) / sum(w)
-        if ignore_nan:
-            # Handle NaN in both data and weights
-            weighted_sum = np.nansum(weights * multilayer_grid, axis=2)
-            weight_sum = np.nansum(weights, axis=2)  # type: ignore[arg-type]
-        else:
-            weighted_sum = np.sum(weights * multilayer_grid, axis=2)
-            weight_sum = np.sum(weights, axis=2)  # type: ignore[arg-type]
-
-        # Avoid division by zero
-        result = np.divide(
-            weighted_sum,
-            weight_sum,
-            out=np.full((nx, ny), np.nan, dtype=dtype),
-            where=(weight_sum != 0),
-        )
-        return result.astype(dtype)  # type: ignore[return-value]
+        # Weighted average: sum(w * x) / sum(w), both sums in one pass
+        result = np.empty((nx, ny), dtype=dtype)
+        _weighted_column_mean(multilayer_grid, weights, ignore_nan, result)
+        return result  # type: ignore[return-value]
 
     if isinstance(strategy, str):
         if strategy == "max":
             func = np.nanmax if ignore_nan else np.max
-            return func(multilayer_grid, axis=2).astype(dtype)
+            return func(multilayer_grid, axis=2).astype(dtype, copy=False)
 
         elif strategy == "min":
             func = np.nanmin if ignore_nan else np.min
-            return func(multilayer_grid, axis=2).astype(dtype)
-
-        elif strategy == "mean":
-            func = np.nanmean if ignore_nan else np.mean
-            return func(multilayer_grid, axis=2, dtype=dtype)
-
-        elif strategy == "sum":
-            func = np.nansum if ignore_nan else np.sum
+            return func(multilayer_grid, axis=2).astype(dtype, copy=False)
+
+        elif strategy in ("mean", "sum"):
+            # `nanmean`/`nansum` copy the grid to mask NaNs, so only use them
+            # when there are NaNs to skip. `nanmax`/`nanmin` have no such cost.
+            skip_nan = ignore_nan and bool(np.isnan(multilayer_grid).any())
+            if strategy == "mean":
+                func = np.nanmean if skip_nan else np.mean
+            else:
+                func = np.nansum if skip_nan else np.sum
             return func(multilayer_grid, axis=2, dtype=dtype)
 
         elif strategy == "top":
@@ -722,8 +788,8 @@ def flatten_multilayer_grid_to_surface(
             test_slice = multilayer_grid[0, 0, :]
             result_scalar = strategy(test_slice)
 
-            # Check if result is scalar
-            if not np.isscalar(result_scalar):
+            # Check if result is scalar (Python/numpy scalar or 0-d array)
+            if np.ndim(result_scalar) != 0:
                 raise ValidationError(
                     f"Custom strategy function must return a scalar, got {type(result_scalar)}"
                 )
@@ -736,20 +802,23 @@ def flatten_multilayer_grid_to_surface(
             try:
                 # Some numpy functions can handle 2D input
                 result_flat = strategy(reshaped)
-                if result_flat.shape == (nx * ny,):  # type: ignore[union-attr]
+                if np.shape(result_flat) == (nx * ny,):
                     return result_flat.reshape(nx, ny).astype(dtype)  # type: ignore[union-attr]
             except (ValueError, TypeError):
-                pass  # Fall back to `apply_along_axis`
+                pass  # Fall back to per-column evaluation
 
-            # Fall back to slower `apply_along_axis`
+            # Fall back to slower per-column evaluation
             warnings.warn(
-                "Using `apply_along_axis` for custom strategy. "
+                "Evaluating custom strategy column by column. "
                 "For better performance, use vectorized numpy functions or built-in strategies.",
                 UserWarning,
                 stacklevel=2,
             )
-            result = np.apply_along_axis(strategy, axis=2, arr=multilayer_grid)
-            return result.astype(dtype)  # type: ignore[return-value]
+            result = np.empty(nx * ny, dtype=dtype)
+            result[0] = result_scalar
+            for index in range(1, nx * ny):
+                result[index] = strategy(reshaped[index])
+            return result.reshape(nx, ny)  # type: ignore[return-value]
 
         except Exception as exc:
             raise ValidationError(f"Custom strategy function failed: {exc}") from exc
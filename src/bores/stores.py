@@ -522,6 +522,11 @@ def _denormalize_from_storage(value: typing.Any) -> typing.Any:
     """Denormalize values from storage (replace sentinel with None)."""
     if _is_none_sentinel(value):
         return None
+    elif isinstance(value, (np.number, np.bool_)):
+        # HDF5 attributes come back as numpy scalars. Convert numeric and boolean
+        # ones to native Python scalars so fields that require a true
+        # `int`/`float`/`bool` load correctly.
+        return value.item()
     elif isinstance(value, list):
         return [_denormalize_from_storage(v) for v in value]
     elif isinstance(value, dict):
@@ -836,7 +841,7 @@ class ZarrStore(DataStore[SerializableT, zarr.Group]):
     def __init__(
         self,
         store: typing.Union[StoreLike, PathLike, str],
-        compressor: typing.Literal["zstd", "lz4", "blosclz"] = "lz4",
+        compressor: typing.Literal["zstd", "lz4", "blosclz"] = "zstd",
         compression_level: int = 1,
         chunks: typing.Optional[typing.Tuple[int, ...]] = None,
     ) -> None:
@@ -844,8 +849,11 @@ class ZarrStore(DataStore[SerializableT, zarr.Group]):
         Initialise the store.
 
         :param store: Zarr store (file path, directory, or `Store` object).
-        :param compressor: Compression algorithm — `'lz4'`, `'zstd'`, or
-            `'blosclz'`.
+        :param compressor: Compression algorithm — `'zstd'` (default), `'lz4'`,
+            or `'blosclz'`. Always applied through Blosc with bit-shuffling,
+            which lets zstd compress smooth float grids roughly twice as well
+            as lz4 at a small CPU cost. Use `'lz4'` when write speed matters
+            more than size.
         :param compression_level: Compression level (1-9).
         :param chunks: Optional explicit chunk shape.  When `None` the store
             picks sensible defaults based on array rank.
@@ -939,11 +947,16 @@ class ZarrStore(DataStore[SerializableT, zarr.Group]):
     ) -> typing.Optional[typing.Tuple[int, ...]]:
         if self.chunks:
             return self.chunks
+        # Chunk sides must be at least 1, even for empty (zero-length) axes
         if len(shape) == 3:
-            return (min(20, shape[0]), min(20, shape[1]), min(20, shape[2]))
+            return (
+                max(1, min(20, shape[0])),
+                max(1, min(20, shape[1])),
+                max(1, min(20, shape[2])),
+            )
         if len(shape) == 2:
-            return (min(100, shape[0]), min(100, shape[1]))
-        return (min(shape[0], 1024),)
+            return (max(1, min(100, shape[0])), max(1, min(100, shape[1])))
+        return (max(1, min(shape[0], 1024)),)
 
     def _create_dataset(
         self, group: zarr.Group, name: str, data: np.ndarray
@@ -1349,6 +1362,10 @@ class HDF5Store(DataStore[SerializableT, h5py.File]):
     ) -> typing.Optional[typing.Tuple[int, ...]]:
         if self.chunks:
             return self.chunks
+        # HDF5 rejects chunks larger than a zero-length axis, so let h5py
+        # pick chunks for empty datasets
+        if 0 in shape:
+            return None
         if len(shape) == 3:
             return (min(20, shape[0]), min(20, shape[1]), min(20, shape[2]))
         elif len(shape) == 2:
@@ -640,10 +640,12 @@ class StateStream(typing.Generic[NDimension]):
         :param indices: Load only the entries at these zero-based insertion-order
             positions.  When given, `steps` and `predicate` are ignored.
         :param steps: Filter by simulation step number.  Accepts either a sequence
-            of exact step numbers (`steps=[0, 100, 200]`) or a callable that
-            receives a step number and returns `bool`
+            of exact step numbers (`steps=[0, 100, 200]`, or an integer array)
+            or a callable that receives a step number and returns `bool`
             (`steps=lambda s: s % 50 == 0`).  Composed with `predicate` when
-            both are provided.
+            both are provided.  `None` (the default) applies no step filter,
+            while an empty sequence (`steps=[]`) matches no step and replays
+            nothing.
         :param predicate: `(EntryMeta) -> bool` filter evaluated against stored
             entry metadata.  Use this for any metadata beyond step number, e.g.
             `predicate=lambda e: e.meta.get("converged")`.  Composed with
@@ -662,7 +664,7 @@ class StateStream(typing.Generic[NDimension]):
         logger.debug(f"Replaying from {self.store}")
 
         pred = predicate
-        if steps:
+        if steps is not None:
             if callable(steps):
 
                 def _predicate(entry: EntryMeta) -> bool:
@@ -8,6 +8,7 @@ import numpy.typing as npt
 import orjson
 from numba.extending import overload  # type: ignore[import-untyped]
 
+from bores.precision import get_dtype
 from bores.types import FloatOrArray
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,7 @@ __all__ = [
     "is_array",
     "max_",
     "min_",
+    "series_to_array",
 ]
 
 
@@ -283,6 +285,25 @@ def overload_to_1d(x, dtype=None):
     return None
 
 
+def series_to_array(
+    series: typing.Iterable[typing.Tuple[float, float]],
+    count: int = -1,
+    dtype: typing.Optional[npt.DTypeLike] = None,
+) -> npt.NDArray:
+    """
+    Collect `(x, y)` pairs, e.g. from the `ModelAnalyst.*_history` generators,
+    into an `(n, 2)` array in a single pass, without an intermediate list.
+
+    :param series: Iterable of `(x, y)` pairs.
+    :param count: Number of pairs to read. If known, the output is allocated once.
+        Defaults to -1 (read until exhausted).
+    :param dtype: Element dtype. Defaults to the global precision dtype.
+    :return: `(n, 2)` array of the pairs.
+    """
+    dtype = dtype if dtype is not None else get_dtype()
+    return np.fromiter(series, dtype=np.dtype((dtype, 2)), count=count)
+
+
 def _numpy_default(obj: typing.Any) -> typing.Mapping[str, typing.Any]:
     if isinstance(obj, np.ndarray):
         # Small arrays are stored as JSON list
@@ -182,6 +182,9 @@ class PlotConfig:
     )
     """Hover mode for interactive plots"""
 
+    webgl_threshold: typing.Optional[int] = 500
+    """Use WebGL (`go.Scattergl`) for series with at least this many points (None = always SVG)"""
+
 
 class PlotType(str, Enum):
     """Enumeration of available 1D plot types."""
@@ -324,6 +327,23 @@ class BaseRenderer(ABC):
             return custom_color
         return self.config.color_palette[index % len(self.config.color_palette)]
 
+    def get_scatter_trace_type(
+        self, num_points: int
+    ) -> typing.Type[typing.Union[go.Scatter, go.Scattergl]]:
+        """
+        Get the scatter trace type for a series of the given length.
+
+        SVG traces create a DOM node per point, so long series are drawn
+        with WebGL once they reach `config.webgl_threshold` points.
+
+        :param num_points: Number of points in the series
+        :return: `go.Scattergl` for long series, `go.Scatter` otherwise
+        """
+        threshold = self.config.webgl_threshold
+        if threshold is not None and num_points >= threshold:
+            return go.Scattergl
+        return go.Scatter
+
     def update_layout(
         self,
         fig: go.Figure,
@@ -501,7 +521,7 @@ class LineRenderer(BaseRenderer):
         :param title: Plot title
         :param width: Figure width in pixels (overrides config)
         :param height: Figure height in pixels (overrides config)
-        :param kwargs: Additional parameters passed to go.Scatter
+        :param kwargs: Additional parameters passed to go.Scatter (go.Scattergl for long series)
         :return: Plotly Figure
 
         Example
@@ -651,7 +671,8 @@ class LineRenderer(BaseRenderer):
                     trace_kwargs["fillcolor"] = fillcolor_rgba
 
             trace_kwargs.update(kwargs)
-            fig.add_trace(go.Scatter(**trace_kwargs))
+            trace_type = self.get_scatter_trace_type(len(x_values))
+            fig.add_trace(trace_type(**trace_kwargs))
 
         # Apply layout
         self.update_layout(
@@ -1094,7 +1115,7 @@ class ScatterRenderer(BaseRenderer):
         :param title: Plot title
         :param width: Figure width in pixels (overrides config)
         :param height: Figure height in pixels (overrides config)
-        :param kwargs: Additional parameters passed to go.Scatter
+        :param kwargs: Additional parameters passed to go.Scatter (go.Scattergl for long series)
         :return: Plotly `go.Figure`
 
         Example:
@@ -1175,7 +1196,8 @@ class ScatterRenderer(BaseRenderer):
                 hoverinfo="skip" if not self.config.show_hover else None,
             )
             trace_kwargs.update(kwargs)
-            fig.add_trace(go.Scatter(**trace_kwargs))
+            trace_type = self.get_scatter_trace_type(len(x_values))
+            fig.add_trace(trace_type(**trace_kwargs))
 
             # Add trendline if requested
             if show_trendline:
@@ -3,6 +3,126 @@
 import sys
 from pathlib import Path
 
+import numpy as np
+import pytest
+
 # Add src directory to Python path for imports
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
+
+
+@pytest.fixture(scope="session")
+def waterflood_states():
+    """
+    States from a short waterflood on a small 4x4x2 grid.
+
+    One injector and one producer in opposite corners, run for ten one-day
+    steps, so the states carry non-zero injection and production rates.
+    """
+    import bores
+
+    grid_shape = (4, 4, 2)
+    with bores.with_precision(np.float64):
+        uniform_grid = bores.build_uniform_grid
+        thickness = uniform_grid(grid_shape, value=20.0)
+        porosity = uniform_grid(grid_shape, value=0.2)
+        Sorw = uniform_grid(grid_shape, value=0.2)
+        Sorg = uniform_grid(grid_shape, value=0.15)
+        Sgr = uniform_grid(grid_shape, value=0.05)
+        Swc = uniform_grid(grid_shape, value=0.2)
+        depth = bores.build_depth_grid(thickness, datum=5000.0)
+        Sw, So, Sg = bores.build_saturation_grids(
+            depth_grid=depth,
+            gas_oil_contact=4999.0,
+            oil_water_contact=5100.0,
+            connate_water_saturation_grid=Swc,
+            residual_oil_saturation_water_grid=Sorw,
+            residual_oil_saturation_gas_grid=Sorg,
+            residual_gas_saturation_grid=Sgr,
+            porosity_grid=porosity,
+        )
+        permeability = uniform_grid(grid_shape, value=100.0)
+        model = bores.reservoir_model(
+            grid_shape=grid_shape,
+            cell_dimension=(100.0, 100.0),
+            thickness_grid=thickness,
+            pressure_grid=uniform_grid(grid_shape, value=3000.0),
+            rock_compressibility=3e-6,
+            absolute_permeability=bores.RockPermeability(
+                x=permeability, y=permeability.copy(), z=permeability.copy()
+            ),
+            porosity_grid=porosity,
+            temperature_grid=uniform_grid(grid_shape, value=180.0),
+            water_saturation_grid=Sw,
+            gas_saturation_grid=Sg,
+            oil_saturation_grid=So,
+            oil_viscosity_grid=uniform_grid(grid_shape, value=1.5),
+            oil_specific_gravity_grid=uniform_grid(grid_shape, value=0.85),
+            oil_bubble_point_pressure_grid=uniform_grid(grid_shape, value=2500.0),
+            residual_oil_saturation_water_grid=Sorw,
+            residual_oil_saturation_gas_grid=Sorg,
+            residual_gas_saturation_grid=Sgr,
+            irreducible_water_saturation_grid=Swc.copy(),
+            connate_water_saturation_grid=Swc,
+            datum_depth=5000,
+        )
+
+        injector = bores.injection_well(
+            well_name="INJ-1",
+            perforating_intervals=[((0, 0, 0), (0, 0, 1))],
+            radius=0.25,
+            control=bores.RateControl(
+                target_rate=100.0, bhp_limit=5000, clamp=bores.InjectionClamp()
+            ),
+            injected_fluid=bores.InjectedFluid(
+                name="Water",
+                phase=bores.FluidPhase.WATER,
+                specific_gravity=1.0,
+                molecular_weight=18.015,
+            ),
+        )
+        producer = bores.production_well(
+            well_name="PROD-1",
+            perforating_intervals=[((3, 3, 0), (3, 3, 1))],
+            radius=0.25,
+            control=bores.ProducerRateControl(
+                controlling_phase="oil",
+                control=bores.AdaptiveRateControl(
+                    target_rate=-100.0,
+                    bhp_limit=1000.0,
+                    clamp=bores.ProductionClamp(),
+                ),
+                clamp=bores.ProductionClamp(),
+            ),
+            produced_fluids=[
+                bores.ProducedFluid(
+                    name="Oil",
+                    phase=bores.FluidPhase.OIL,
+                    specific_gravity=0.85,
+                    molecular_weight=200.0,
+                ),
+                bores.ProducedFluid(
+                    name="Water",
+                    phase=bores.FluidPhase.WATER,
+                    specific_gravity=1.0,
+                    molecular_weight=18.015,
+                ),
+            ],
+        )
+        config = bores.Config(
+            timer=bores.Timer(
+                initial_step_size=bores.Time(days=1),
+                maximum_step_size=bores.Time(days=1),
+                minimum_step_size=bores.Time(hours=1),
+                simulation_time=bores.Time(days=10),
+            ),
+            rock_fluid_tables=bores.RockFluidTables(
+                relative_permeability_table=bores.BrooksCoreyRelPermModel(
+                    water_exponent=2.0, oil_exponent=2.0, gas_exponent=2.0
+                ),
+                capillary_pressure_table=bores.BrooksCoreyCapillaryPressureModel(),
+            ),
+            wells=bores.wells_(injectors=[injector], producers=[producer]),
+            scheme="impes",
+        )
+        return list(bores.run(model, config))
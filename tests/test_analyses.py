@@ -0,0 +1,63 @@
+"""Tests for model analyses."""
+
+import pytest
+
+from bores.analyses import ModelAnalyst
+
+IN_PLACE_METHODS = {
+    "oil_in_place_history": "oil_in_place",
+    "gas_in_place_history": "free_gas_in_place",
+    "water_in_place_history": "water_in_place",
+}
+
+
+class TestInPlaceHistory:
+    """Tests that in-place histories match per-step in-place values."""
+
+    @pytest.mark.parametrize("history_method", list(IN_PLACE_METHODS))
+    @pytest.mark.parametrize(
+        "from_step, to_step, interval",
+        [(0, -1, 1), (0, -1, 3), (2, -1, 3), (3, 9, 2), (5, 5, 1)],
+    )
+    def test_matches_per_step_values(
+        self, waterflood_states, history_method, from_step, to_step, interval
+    ):
+        """Test the incremental history against a fresh analyst's per-step values."""
+        history = list(
+            getattr(ModelAnalyst(waterflood_states), history_method)(
+                from_step=from_step, to_step=to_step, interval=interval
+            )
+        )
+
+        last_step = waterflood_states[-1].step if to_step == -1 else to_step
+        expected_steps = list(range(from_step, last_step + 1, interval))
+        assert [step for step, _ in history] == expected_steps
+
+        reference = ModelAnalyst(waterflood_states)
+        in_place = getattr(reference, IN_PLACE_METHODS[history_method])
+        for step, value in history:
+            assert value == pytest.approx(in_place(step), rel=1e-12, abs=1e-9)
+
+    def test_history_changes_with_production(self, waterflood_states):
+        """Test that oil and water in place change over the run."""
+        analyst = ModelAnalyst(waterflood_states)
+        oil = dict(analyst.oil_in_place_history(interval=5))
+        water = dict(analyst.water_in_place_history(interval=5))
+        assert oil[10] < oil[5] < oil[0]
+        assert water[10] != water[0]
+
+    def test_history_after_per_step_queries(self, waterflood_states):
+        """Test that a history reuses values already cached by per-step queries."""
+        analyst = ModelAnalyst(waterflood_states)
+        cached = {step: analyst.oil_in_place(step) for step in (4, 8)}
+        history = dict(analyst.oil_in_place_history(from_step=2, interval=2))
+
+        reference = ModelAnalyst(waterflood_states)
+        for step, value in history.items():
+            assert value == pytest.approx(reference.oil_in_place(step), rel=1e-12)
+        assert history[4] == cached[4]
+        assert history[8] == cached[8]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,427 @@
+"""Tests for gridding utilities (coarsening, flattening, padding)."""
+
+import numpy as np
+import pytest
+
+from bores.errors import ValidationError
+from bores.grids.utils import (
+    coarsen_grid,
+    coarsen_permeability_grids,
+    flatten_multilayer_grid_to_surface,
+    get_pad_mask,
+)
+
+
+def _padded_coarsen_reference(data, batch_size, method, epsilon=1e-10):
+    """Pad-and-reshape numpy reference for `coarsen_grid`."""
+    pad_width = [(0, (b - dim % b) % b) for dim, b in zip(data.shape, batch_size)]
+    pad_value = 0.0 if method == "sum" else np.nan
+    padded = np.pad(
+        data.astype(np.float64),
+        pad_width,
+        mode="constant",
+        constant_values=pad_value,
+    )
+    blocked_shape = []
+    for dim, b in zip(padded.shape, batch_size):
+        blocked_shape.extend([dim // b, b])
+    blocked = padded.reshape(blocked_shape)
+    axes = tuple(range(1, blocked.ndim, 2))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if method == "mean":
+            return np.nanmean(blocked, axis=axes)
+        if method == "sum":
+            return blocked.sum(axis=axes)
+        if method == "max":
+            return np.nanmax(blocked, axis=axes)
+        if method == "min":
+            return np.nanmin(blocked, axis=axes)
+
+        reciprocals = np.where(np.isnan(blocked), np.nan, 1.0 / (blocked + epsilon))
+        counts = np.sum(~np.isnan(blocked), axis=axes)
+        harmonic = counts / np.nansum(reciprocals, axis=axes)
+        harmonic = np.where(counts == 0, np.nan, harmonic)
+        return np.where(np.isinf(harmonic), 0.0, harmonic)
+
+
+def _grid_with_nans(shape, seed=0):
+    rng = np.random.default_rng(seed)
+    data = rng.uniform(1.0, 500.0, size=shape)
+    data[rng.random(shape) < 0.2] = np.nan
+    # First block is entirely NaN
+    data[(slice(0, 2),) * len(shape)] = np.nan
+    return data
+
+
+def _axis_harmonic_mean_reference(data, axis, epsilon=1e-10):
+    """Harmonic mean along `axis`, ignoring NaN (previous numpy implementation)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        reciprocals = np.where(np.isnan(data), np.nan, 1.0 / (data + epsilon))
+        counts = np.sum(~np.isnan(data), axis=axis)
+        result = counts / (np.nansum(reciprocals, axis=axis) + epsilon)
+        result = np.where(counts == 0, np.nan, result)
+        return np.where(np.isinf(result), 0.0, result)
+
+
+def _permeability_coarsen_reference(grids, batch_size, epsilon=1e-10):
+    """
+    Harmonic mean in each grid's flow direction, then arithmetic mean over the
+    other directions, on NaN-padded blocked reshapes.
+    """
+    ndim = len(batch_size)
+    pad_width = [(0, (b - dim % b) % b) for dim, b in zip(grids[0].shape, batch_size)]
+    results = []
+    for direction, grid in enumerate(grids):
+        padded = np.pad(grid, pad_width, mode="constant", constant_values=np.nan)
+        blocked_shape = []
+        for dim, b in zip(padded.shape, batch_size):
+            blocked_shape.extend([dim // b, b])
+        blocked = padded.reshape(blocked_shape)
+
+        harmonic = _axis_harmonic_mean_reference(
+            blocked, axis=2 * direction + 1, epsilon=epsilon
+        )
+        # Block axes left after removing the harmonic axis
+        arithmetic_axes = tuple(
+            2 * axis + 1 - (1 if axis > direction else 0)
+            for axis in range(ndim)
+            if axis != direction
+        )
+        with np.errstate(invalid="ignore"):
+            results.append(np.nanmean(harmonic, axis=arithmetic_axes))
+    return tuple(results)
+
+
+def _permeability_grid(shape, seed):
+    rng = np.random.default_rng(seed)
+    grid = rng.lognormal(mean=4.0, sigma=1.0, size=shape)
+    grid[rng.random(shape) < 0.1] = 0.0  # Zero-permeability (barrier) cells
+    grid[rng.random(shape) < 0.1] = np.nan
+    return grid
+
+
+METHODS = ("mean", "sum", "max", "min", "harmonic")
+
+
+class TestCoarsenGrid:
+    """Tests for `coarsen_grid` against a padded numpy reference."""
+
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    @pytest.mark.parametrize("method", METHODS)
+    @pytest.mark.parametrize(
+        "shape, batch_size",
+        [
+            ((8, 6), (2, 3)),
+            ((9, 7), (2, 3)),  # Non-dividing block sizes
+            ((8, 6, 4), (2, 2, 2)),
+            ((9, 7, 5), (2, 3, 2)),  # Non-dividing block sizes
+            ((5, 4, 3), (5, 4, 3)),  # Single block
+        ],
+    )
+    def test_matches_padded_reference(self, method, shape, batch_size):
+        """Test each method against the pad-and-reshape numpy result."""
+        data = _grid_with_nans(shape)
+        result = coarsen_grid(data, batch_size=batch_size, method=method)
+        expected = _padded_coarsen_reference(data, batch_size, method)
+        assert result.shape == expected.shape
+        np.testing.assert_allclose(result, expected, rtol=1e-12, equal_nan=True)
+
+    @pytest.mark.parametrize("method", ("mean", "max", "min", "harmonic"))
+    def test_all_nan_block_is_nan(self, method):
+        """Test that a block with no valid cells coarsens to NaN."""
+        data = np.ones((4, 4, 2))
+        data[:2, :2, :] = np.nan
+        result = coarsen_grid(data, batch_size=(2, 2, 2), method=method)
+        assert np.isnan(result[0, 0, 0])
+        assert not np.isnan(result[1:, 1:, :]).any()
+
+    def test_sum_propagates_nan(self):
+        """Test that 'sum' propagates NaN while clipped edge cells add nothing."""
+        data = np.ones((3, 3))
+        data[0, 0] = np.nan
+        result = coarsen_grid(data, batch_size=(2, 2), method="sum")
+        assert np.isnan(result[0, 0])
+        np.testing.assert_array_equal(result[1, 1], 1.0)
+        np.testing.assert_array_equal(result[0, 1], 2.0)
+
+    def test_harmonic_infinite_mean_is_zero(self):
+        """Test that an infinite harmonic mean is reported as zero."""
+        data = np.full((2, 2), np.inf)
+        result = coarsen_grid(data, batch_size=(2, 2), method="harmonic")
+        np.testing.assert_array_equal(result, [[0.0]])
+
+    def test_float32_input_matches_reference(self):
+        """Test that float32 input is accumulated without float32 round-off."""
+        data = _grid_with_nans((16, 16, 8)).astype(np.float32)
+        result = coarsen_grid(data, batch_size=(4, 4, 4), method="mean")
+        expected = _padded_coarsen_reference(data, (4, 4, 4), "mean")
+        np.testing.assert_allclose(result, expected, rtol=1e-12, equal_nan=True)
+
+    @pytest.mark.parametrize("shape", [(8,), (4, 4, 4, 4)])
+    def test_rejects_non_2d_or_3d_input(self, shape):
+        """Test that 1D and 4D input raises ValidationError."""
+        data = np.ones(shape)
+        with pytest.raises(ValidationError, match="2D or 3D"):
+            coarsen_grid(data, batch_size=(2,) * len(shape))
+
+    def test_rejects_custom_callable_method(self):
+        """Test that a callable is not accepted as an aggregation method."""
+        data = np.ones((4, 4))
+        with pytest.raises(ValidationError, match="Unsupported method"):
+            coarsen_grid(data, batch_size=(2, 2), method=np.nanmedian)  # type: ignore[arg-type]
+
+    def test_rejects_mismatched_batch_size(self):
+        """Test that batch_size length must match data.ndim."""
+        with pytest.raises(ValidationError, match="must match data.ndim"):
+            coarsen_grid(np.ones((4, 4)), batch_size=(2, 2, 2))
+
+
+class TestCoarsenPermeabilityGrids:
+    """Tests for direction-aware permeability coarsening."""
+
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    @pytest.mark.parametrize(
+        "shape, batch_size",
+        [
+            ((8, 6, 4), (2, 2, 2)),
+            ((9, 7, 5), (2, 3, 2)),  # Non-dividing block sizes
+            ((6, 6, 6), (3, 1, 4)),
+            ((4, 4, 4), (1, 1, 1)),
+        ],
+    )
+    def test_3d_matches_harmonic_then_arithmetic_reference(self, shape, batch_size):
+        """Test 3D kx/ky/kz coarsening against the previous numpy results."""
+        grids = tuple(_permeability_grid(shape, seed) for seed in range(3))
+        result = coarsen_permeability_grids(*grids, batch_size=batch_size)
+        expected = _permeability_coarsen_reference(grids, batch_size)
+        assert len(result) == 3
+        for coarse, reference in zip(result, expected):
+            assert coarse.shape == reference.shape
+            np.testing.assert_allclose(coarse, reference, rtol=1e-12, equal_nan=True)
+
+    def test_3d_layered_permeability(self):
+        """Test that a low-permeability layer dominates only across-layer flow."""
+        kz = np.full((2, 2, 2), 100.0)
+        kz[:, :, 1] = 1.0
+        kx = ky = kz.copy()
+        kx_coarse, ky_coarse, kz_coarse = coarsen_permeability_grids(
+            kx, ky, kz, batch_size=(2, 2, 2)
+        )
+        # Flow along layers: arithmetic across layers
+        np.testing.assert_allclose(kx_coarse, 50.5, rtol=1e-6)
+        np.testing.assert_allclose(ky_coarse, 50.5, rtol=1e-6)
+        # Flow across layers: harmonic across layers
+        np.testing.assert_allclose(kz_coarse, 2.0 / (1 / 100.0 + 1.0), rtol=1e-6)
+
+    def test_3d_zero_permeability_block(self):
+        """Test that an all-zero block coarsens to (near) zero, not NaN or inf."""
+        grids = tuple(np.zeros((2, 2, 2)) for _ in range(3))
+        for coarse in coarsen_permeability_grids(*grids, batch_size=(2, 2, 2)):
+            assert np.isfinite(coarse).all()
+            np.testing.assert_allclose(coarse, 0.0, atol=1e-9)
+
+    def test_3d_all_nan_block_is_nan(self):
+        """Test that a block with no valid cells coarsens to NaN."""
+        grids = tuple(np.ones((4, 2, 2)) for _ in range(3))
+        for grid in grids:
+            grid[:2] = np.nan
+        for coarse in coarsen_permeability_grids(*grids, batch_size=(2, 2, 2)):
+            assert np.isnan(coarse[0, 0, 0])
+            np.testing.assert_allclose(coarse[1, 0, 0], 1.0, rtol=1e-6)
+
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    @pytest.mark.parametrize(
+        "shape, batch_size",
+        [
+            ((8, 6), (2, 2)),
+            ((9, 7), (2, 3)),  # Non-dividing block sizes
+            ((5, 6), (5, 6)),
+            ((4, 4), (1, 1)),
+        ],
+    )
+    def test_2d_matches_harmonic_then_arithmetic_reference(self, shape, batch_size):
+        """Test 2D kx/ky coarsening against the previous numpy results."""
+        grids = tuple(_permeability_grid(shape, seed) for seed in range(2))
+        result = coarsen_permeability_grids(*grids, batch_size=batch_size)
+        expected = _permeability_coarsen_reference(grids, batch_size)
+        assert len(result) == 2
+        for coarse, reference in zip(result, expected):
+            assert coarse.shape == reference.shape
+            np.testing.assert_allclose(coarse, reference, rtol=1e-12, equal_nan=True)
+
+    def test_2d_layered_permeability(self):
+        """Test that kx and ky average along their own flow direction."""
+        kx = np.array([[100.0, 1.0], [100.0, 1.0]])
+        kx_coarse, ky_coarse = coarsen_permeability_grids(
+            kx, kx.copy(), batch_size=(2, 2)
+        )
+        # Columns of constant value along x: harmonic in x is exact, then mean in y
+        np.testing.assert_allclose(kx_coarse, 50.5, rtol=1e-6)
+        # Varying along y: harmonic across y, then mean in x
+        np.testing.assert_allclose(ky_coarse, 2.0 / (1 / 100.0 + 1.0), rtol=1e-6)
+
+
+class TestGetPadMask:
+    """Tests for `get_pad_mask`."""
+
+    @pytest.mark.parametrize("grid_shape", [(4, 5), (3, 4, 5)])
+    @pytest.mark.parametrize("pad_width", [1, 2])
+    def test_marks_every_padding_cell(self, grid_shape, pad_width):
+        """Test that every padding cell is True and every core cell is False."""
+        mask = get_pad_mask(grid_shape, pad_width=pad_width)
+        assert mask.dtype == np.bool_
+        assert mask.shape == tuple(dim + 2 * pad_width for dim in grid_shape)
+
+        core = tuple(slice(pad_width, pad_width + dim) for dim in grid_shape)
+        assert not mask[core].any()
+        # Every cell outside the core is padding
+        assert mask.sum() == mask.size - np.prod(grid_shape)
+
+        # Faces, edges and corners on both sides of every axis
+        for axis in range(len(grid_shape)):
+            leading = [slice(None)] * len(grid_shape)
+            trailing = [slice(None)] * len(grid_shape)
+            leading[axis] = slice(0, pad_width)
+            trailing[axis] = slice(-pad_width, None)
+            assert mask[tuple(leading)].all()
+            assert mask[tuple(trailing)].all()
+
+    @pytest.mark.parametrize("grid_shape", [(4, 5), (3, 4, 5)])
+    def test_matches_constant_padding(self, grid_shape):
+        """Test against padding an all-False grid with True."""
+        expected = np.pad(np.zeros(grid_shape, dtype=bool), 2, constant_values=True)
+        np.testing.assert_array_equal(get_pad_mask(grid_shape, pad_width=2), expected)
+
+    @pytest.mark.parametrize("grid_shape", [(4, 5), (3, 4, 5)])
+    def test_zero_pad_width(self, grid_shape):
+        """Test that no padding gives an all-False mask of the grid's shape."""
+        mask = get_pad_mask(grid_shape, pad_width=0)
+        assert mask.shape == grid_shape
+        assert not mask.any()
+
+
+def _weighted_average_reference(grid, weights):
+    """Per-column `np.average`, with NaN where a column's weights sum to zero."""
+    nx, ny, _ = grid.shape
+    expected = np.full((nx, ny), np.nan)
+    for i in range(nx):
+        for j in range(ny):
+            if weights[i, j].sum() != 0.0:
+                expected[i, j] = np.average(grid[i, j], weights=weights[i, j])
+    return expected
+
+
+class TestFlattenWeightedMean:
+    """Tests for the `"weighted_mean"` flattening strategy."""
+
+    @staticmethod
+    def _grid_and_weights(shape=(5, 4, 6), seed=0):
+        rng = np.random.default_rng(seed)
+        grid = rng.uniform(0.0, 1.0, size=shape)
+        weights = rng.uniform(0.5, 3.0, size=shape)
+        # Some zero-weight layers, and whole columns with zero total weight
+        weights[weights < 1.0] = 0.0
+        weights[0, 0, :] = 0.0
+        weights[-1, 2, :] = 0.0
+        return grid, weights
+
+    @pytest.mark.parametrize("ignore_nan", [True, False])
+    def test_matches_numpy_average(self, ignore_nan):
+        """Test against per-column `np.average(..., weights=...)`."""
+        grid, weights = self._grid_and_weights()
+        result = flatten_multilayer_grid_to_surface(
+            grid, strategy="weighted_mean", weights=weights, ignore_nan=ignore_nan
+        )
+        np.testing.assert_allclose(
+            result, _weighted_average_reference(grid, weights), rtol=1e-12
+        )
+
+    def test_zero_weight_columns_are_nan(self):
+        """Test that columns whose weights sum to zero give NaN."""
+        grid, weights = self._grid_and_weights()
+        result = flatten_multilayer_grid_to_surface(
+            grid, strategy="weighted_mean", weights=weights
+        )
+        zero_weight = weights.sum(axis=2) == 0.0
+        assert zero_weight[0, 0] and zero_weight[-1, 2]
+        assert np.isnan(result[zero_weight]).all()
+        assert np.isfinite(result[~zero_weight]).all()
+
+    def test_ignores_nan_values_and_weights(self):
+        """Test that NaN values and weights are skipped with `ignore_nan=True`."""
+        grid, weights = self._grid_and_weights(seed=1)
+        grid[1, 1, 0] = np.nan
+        weights[2, 3, 1] = np.nan
+        weights[3, 0, :] = np.nan
+
+        result = flatten_multilayer_grid_to_surface(
+            grid, strategy="weighted_mean", weights=weights, ignore_nan=True
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            expected = np.nansum(grid * weights, axis=2) / np.nansum(weights, axis=2)
+        expected[np.nansum(weights, axis=2) == 0.0] = np.nan
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+        assert np.isnan(result[3, 0])
+
+    def test_propagates_nan_without_ignore_nan(self):
+        """Test that NaN propagates to its column with `ignore_nan=False`."""
+        grid, weights = self._grid_and_weights(seed=1)
+        weights[1, 1, :] = 1.0
+        grid[1, 1, 0] = np.nan
+        result = flatten_multilayer_grid_to_surface(
+            grid, strategy="weighted_mean", weights=weights, ignore_nan=False
+        )
+        assert np.isnan(result[1, 1])
+        expected = _weighted_average_reference(grid, weights)
+        mask = np.ones(result.shape, dtype=bool)
+        mask[1, 1] = False
+        np.testing.assert_allclose(result[mask], expected[mask], rtol=1e-12)
+
+
+class TestFlattenCustomStrategy:
+    """Tests for `flatten_multilayer_grid_to_surface` with a callable strategy."""
+
+    @staticmethod
+    def _grid(shape=(4, 3, 5), seed=0):
+        return np.random.default_rng(seed).uniform(0.0, 1.0, size=shape)
+
+    def test_python_scalar_reducer_falls_back_per_column(self):
+        """Test a reducer returning a Python scalar for any input shape."""
+        grid = self._grid()
+
+        def count_above(column):
+            return float(np.sum(column > 0.5))
+
+        with pytest.warns(UserWarning, match="column by column"):
+            result = flatten_multilayer_grid_to_surface(grid, strategy=count_above)
+        assert result.shape == grid.shape[:2]
+        np.testing.assert_array_equal(result, np.sum(grid > 0.5, axis=2))
+
+    def test_zero_dimensional_array_reducer(self):
+        """Test a reducer returning a 0-d array."""
+        grid = self._grid()
+
+        def column_max(column):
+            return np.asarray(np.max(column))
+
+        with pytest.warns(UserWarning, match="column by column"):
+            result = flatten_multilayer_grid_to_surface(grid, strategy=column_max)
+        np.testing.assert_array_equal(result, grid.max(axis=2))
+
+    def test_vectorized_reducer(self):
+        """Test a reducer that also works on the reshaped 2D grid."""
+        grid = self._grid()
+        result = flatten_multilayer_grid_to_surface(
+            grid, strategy=lambda z: np.percentile(z, 90, axis=-1)
+        )
+        np.testing.assert_allclose(result, np.percentile(grid, 90, axis=2))
+
+    def test_rejects_non_scalar_reducer(self):
+        """Test that a reducer returning an array per column is rejected."""
+        with pytest.raises(ValidationError, match="must return a scalar"):
+            flatten_multilayer_grid_to_surface(self._grid(), strategy=lambda z: z[:2])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,156 @@
+"""Tests for storage backends (HDF5, Zarr)."""
+
+import typing
+
+import attrs
+import numpy as np
+import pytest
+
+from bores.serialization import Serializable
+from bores.stores import HDF5Store, ZarrStore
+from bores.timing import Timer
+
+
+@attrs.define
+class GridSnapshot(Serializable):
+    """Small state-like record whose dump holds arrays with zero-length axes."""
+
+    step: int
+    pressure: np.ndarray
+    """Dumped as an encoded dict with a `shape` list (empty for 0-d arrays)."""
+    history: typing.List[float]
+    """Stored as a 1D dataset, of shape `(0,)` when empty."""
+    layers: typing.List[typing.List[float]]
+    """Stored as a 2D dataset, of shape `(n, 0)` when the rows are empty."""
+    blocks: typing.List[typing.List[typing.List[float]]]
+    """Stored as a 3D dataset, of shape `(n, m, 0)` when the blocks are empty."""
+
+
+@attrs.define
+class RunSettings(Serializable):
+    """Record of scalar fields whose Python types must survive storage."""
+
+    label: str
+    max_newton_iterations: int
+    tolerance: float
+    adaptive: bool
+    max_steps: typing.Optional[int] = None
+    notes: typing.Optional[str] = None
+
+
+def _new_store(store_type, tmp_path):
+    if store_type is HDF5Store:
+        return HDF5Store(tmp_path / "states.h5")
+    return ZarrStore(tmp_path / "states.zarr")
+
+
+@pytest.fixture(params=[HDF5Store, ZarrStore], ids=["hdf5", "zarr"])
+def store_type(request):
+    return request.param
+
+
+def _empty_snapshot(step=0):
+    return GridSnapshot(
+        step=step,
+        pressure=np.array(2500.0),
+        history=[],
+        layers=[[], []],
+        blocks=[[[], [], []], [[], [], []]],
+    )
+
+
+def _assert_snapshots_equal(loaded, expected):
+    assert loaded.step == expected.step
+    assert loaded.pressure.shape == expected.pressure.shape
+    np.testing.assert_array_equal(loaded.pressure, expected.pressure)
+    assert loaded.history == expected.history
+    assert loaded.layers == expected.layers
+    assert loaded.blocks == expected.blocks
+
+
+class TestEmptyAxisRoundTrip:
+    """Tests for storing zero-length-axis datasets under default chunking."""
+
+    def test_dump_and_load(self, store_type, tmp_path):
+        """Test that a snapshot with empty axes survives `dump`/`load`."""
+        store = _new_store(store_type, tmp_path)
+        snapshot = _empty_snapshot()
+        store.dump([snapshot])
+
+        loaded = list(store.load(GridSnapshot))
+        assert len(loaded) == 1
+        _assert_snapshots_equal(loaded[0], snapshot)
+
+    def test_append_and_load(self, store_type, tmp_path):
+        """Test that empty-axis snapshots survive `append` with an open handle."""
+        store = _new_store(store_type, tmp_path)
+        snapshots = [_empty_snapshot(step) for step in range(3)]
+        with store(mode="a"):
+            for snapshot in snapshots:
+                store.append(snapshot)
+
+        loaded = list(store.load(GridSnapshot))
+        assert [state.step for state in loaded] == [0, 1, 2]
+        for state, snapshot in zip(loaded, snapshots):
+            _assert_snapshots_equal(state, snapshot)
+
+    def test_empty_and_filled_fields(self, store_type, tmp_path):
+        """Test that empty datasets are stored alongside non-empty ones."""
+        store = _new_store(store_type, tmp_path)
+        snapshot = GridSnapshot(
+            step=7,
+            pressure=np.arange(24.0).reshape(2, 3, 4),
+            history=[1.0, 2.0, 3.0],
+            layers=[[], []],
+            blocks=[[[1.0, 2.0]], [[3.0, 4.0]]],
+        )
+        store.dump([snapshot])
+        _assert_snapshots_equal(next(store.load(GridSnapshot)), snapshot)
+
+
+class TestScalarFieldTypes:
+    """Tests that scalar fields load back as their declared Python types."""
+
+    def test_declared_types_preserved(self, store_type, tmp_path):
+        """Test that int, float, bool and str fields are not left as numpy scalars."""
+        store = _new_store(store_type, tmp_path)
+        settings = RunSettings(
+            label="spe1",
+            max_newton_iterations=25,
+            tolerance=1e-6,
+            adaptive=True,
+            max_steps=1460,
+        )
+        store.dump([settings])
+
+        loaded = next(store.load(RunSettings))
+        assert loaded == settings
+        assert type(loaded.label) is str
+        assert type(loaded.max_newton_iterations) is int
+        assert type(loaded.tolerance) is float
+        assert type(loaded.adaptive) is bool
+        assert type(loaded.max_steps) is int
+        assert loaded.notes is None
+
+    def test_timer_round_trip(self, store_type, tmp_path):
+        """Test that a `Timer` loads with integer window sizes for its deques."""
+        store = _new_store(store_type, tmp_path)
+        timer = Timer(
+            initial_step_size=10.0,
+            maximum_step_size=100.0,
+            minimum_step_size=1.0,
+            simulation_time=1000.0,
+            maximum_steps=50,
+            metrics_history_size=7,
+        )
+        store.dump([timer])
+
+        loaded = next(store.load(Timer))
+        assert type(loaded.maximum_steps) is int
+        assert type(loaded.metrics_history_size) is int
+        assert loaded.recent_metrics.maxlen == 7
+        assert loaded.simulation_time == timer.simulation_time
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
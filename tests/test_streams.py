@@ -0,0 +1,57 @@
+"""Tests for state streaming and replay."""
+
+import numpy as np
+import pytest
+
+from bores.stores import ZarrStore
+from bores.streams import StateStream
+
+
+@pytest.fixture
+def saved_stream(waterflood_states, tmp_path):
+    """A consumed `StateStream` whose states are saved in a Zarr store."""
+    stream = StateStream(
+        states=iter(waterflood_states),
+        store=ZarrStore(tmp_path / "states.zarr"),
+        batch_size=4,
+    )
+    stream.consume()
+    return stream
+
+
+class TestReplayStepFilter:
+    """Tests for the `steps` filter of `StateStream.replay`."""
+
+    def test_steps_none_replays_everything(self, saved_stream, waterflood_states):
+        """Test that `steps=None` (the default) applies no step filter."""
+        all_steps = [state.step for state in waterflood_states]
+        assert [s.step for s in saved_stream.replay()] == all_steps
+        assert [s.step for s in saved_stream.replay(steps=None)] == all_steps
+
+    def test_empty_steps_replays_nothing(self, saved_stream):
+        """Test that an empty step sequence matches no step."""
+        assert list(saved_stream.replay(steps=[])) == []
+        assert list(saved_stream.replay(steps=np.array([], dtype=int))) == []
+
+    def test_step_sequence(self, saved_stream):
+        """Test replaying an explicit list of step numbers."""
+        replayed = saved_stream.replay(steps=[0, 3, 7, 99])
+        assert [state.step for state in replayed] == [0, 3, 7]
+
+    def test_step_array(self, saved_stream):
+        """Test replaying a numpy array of step numbers."""
+        steps = np.concatenate([[0, 1], np.arange(4, 11, 4)])
+        replayed = saved_stream.replay(steps=steps)
+        assert [state.step for state in replayed] == [0, 1, 4, 8]
+
+    def test_step_callable_and_predicate(self, saved_stream):
+        """Test that a callable step filter is composed with `predicate`."""
+        replayed = saved_stream.replay(
+            steps=lambda step: step % 2 == 0,
+            predicate=lambda entry: entry.idx > 2,
+        )
+        assert [state.step for state in replayed] == [4, 6, 8, 10]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
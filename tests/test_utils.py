@@ -0,0 +1,73 @@
+"""Tests for general utilities."""
+
+import numpy as np
+import pytest
+
+from bores.precision import with_precision
+from bores.utils import series_to_array
+
+
+def _pairs(n):
+    """Generate `n` `(step, value)` pairs, like the analyst history generators."""
+    for step in range(n):
+        yield step, 0.5 * step + 1.0
+
+
+class TestSeriesToArray:
+    """Tests for series_to_array."""
+
+    def test_matches_array_of_list(self):
+        """Test that the output matches `np.array(list(series))`."""
+        result = series_to_array(_pairs(7))
+        expected = np.array(list(_pairs(7)))
+        assert result.shape == (7, 2)
+        np.testing.assert_array_equal(result, expected)
+
+    def test_default_count_reads_until_exhausted(self):
+        """Test that the default `count=-1` consumes the whole series."""
+        series = _pairs(5)
+        result = series_to_array(series)
+        assert result.shape == (5, 2)
+        assert next(series, None) is None
+
+    def test_explicit_count(self):
+        """Test that an explicit count reads exactly that many pairs."""
+        series = _pairs(10)
+        result = series_to_array(series, count=4)
+        np.testing.assert_array_equal(result, np.array(list(_pairs(4))))
+        # The rest of the series is left unread
+        assert next(series) == (4, 3.0)
+
+    def test_count_larger_than_series_raises(self):
+        """Test that asking for more pairs than the series yields raises."""
+        with pytest.raises(ValueError):
+            series_to_array(_pairs(3), count=5)
+
+    def test_empty_series(self):
+        """Test that an empty series gives an empty `(0, 2)` array."""
+        result = series_to_array(_pairs(0))
+        assert result.shape == (0, 2)
+        assert series_to_array(iter([]), count=0).shape == (0, 2)
+
+    @pytest.mark.parametrize("precision", [np.float32, np.float64])
+    def test_default_dtype_follows_precision(self, precision):
+        """Test that `dtype=None` uses the global precision dtype."""
+        with with_precision(precision):
+            result = series_to_array(_pairs(3))
+        assert result.dtype == precision
+
+    def test_explicit_dtype(self):
+        """Test that an explicit dtype overrides the global precision."""
+        with with_precision(np.float32):
+            result = series_to_array(_pairs(3), dtype=np.float64)
+        assert result.dtype == np.float64
+        np.testing.assert_array_equal(result, [[0.0, 1.0], [1.0, 1.5], [2.0, 2.0]])
+
+    def test_accepts_any_iterable(self):
+        """Test that lists of pairs are accepted as well as generators."""
+        pairs = [(0, 1.5), (1, 2.5)]
+        np.testing.assert_array_equal(series_to_array(pairs), np.array(pairs))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,5 +1,7 @@
 """Tests for visualization base module (property registry, colorbars, etc.)."""
 
+import numpy as np
+import plotly.graph_objects as go
 import pytest
 
 from bores.visualization.base import (
@@ -8,6 +10,7 @@ from bores.visualization.base import (
     PropertyRegistry,
     property_registry,
 )
+from bores.visualization.plotly1d import LineRenderer, PlotConfig, ScatterRenderer
 
 
 class TestColorScheme:
@@ -145,5 +148,44 @@ class TestPropertyRegistry:
         assert retrieved.display_name == "Custom Property"
 
 
+def _series(num_points):
+    x = np.arange(num_points, dtype=float)
+    return np.column_stack([x, np.sin(x)])
+
+
+class TestScatterTraceType:
+    """Tests for choosing SVG or WebGL scatter traces by series length."""
+
+    def test_default_threshold(self):
+        """Test the default threshold of 500 points."""
+        renderer = LineRenderer()
+        assert renderer.config.webgl_threshold == 500
+        assert renderer.get_scatter_trace_type(0) is go.Scatter
+        assert renderer.get_scatter_trace_type(499) is go.Scatter
+        assert renderer.get_scatter_trace_type(500) is go.Scattergl
+        assert renderer.get_scatter_trace_type(10_000) is go.Scattergl
+
+    def test_custom_threshold(self):
+        """Test that a custom `webgl_threshold` is respected."""
+        renderer = LineRenderer(config=PlotConfig(webgl_threshold=10))
+        assert renderer.get_scatter_trace_type(9) is go.Scatter
+        assert renderer.get_scatter_trace_type(10) is go.Scattergl
+        assert renderer.get_scatter_trace_type(11) is go.Scattergl
+
+    def test_no_threshold_always_svg(self):
+        """Test that `webgl_threshold=None` never uses WebGL."""
+        renderer = LineRenderer(config=PlotConfig(webgl_threshold=None))
+        assert renderer.get_scatter_trace_type(1_000_000) is go.Scatter
+
+    @pytest.mark.parametrize("renderer_type", [LineRenderer, ScatterRenderer])
+    def test_rendered_trace_types(self, renderer_type):
+        """Test that rendered traces switch to WebGL at the threshold."""
+        renderer = renderer_type(config=PlotConfig(webgl_threshold=10))
+        fig = renderer.render({"short": _series(9), "long": _series(10)})
+        traces = {trace.name: trace for trace in fig.data}
+        assert type(traces["short"]) is go.Scatter
+        assert type(traces["long"]) is go.Scattergl
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])